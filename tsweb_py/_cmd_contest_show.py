@@ -0,0 +1,80 @@
+"""`tsweb_py contest show` command."""
+
+import click
+
+from .cli import get_client, get_local_config
+from .utils.terminal import (
+    fill_table,
+    get_console,
+    make_compilers_table,
+    make_problems_table,
+)
+
+
+@click.command(name="show")
+@click.pass_obj
+def contest_show(obj: dict):
+    """Display current contest information, problems and compilers."""
+    console = get_console()
+    client = get_client(obj)
+    
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    console.print("[cyan]Fetching contest information...[/cyan]")
+    bundle = client.get_contest_bundle()
+    user_info, problems, compilers = bundle.user_info, bundle.problems, bundle.compilers
+
+    # Show current contest and user info
+    if "contest" in user_info:
+        console.print(
+            f"\n[bold cyan]Current Contest:[/bold cyan] {user_info['contest']}"
+        )
+    if "name" in user_info:
+        console.print(f"[bold cyan]User:[/bold cyan] {user_info['name']}")
+
+    # Load default compiler index from local config
+    config = get_local_config(obj)
+    default_lang = config.default_lang if config else 0
+
+    # Show default compiler
+    if compilers and 0 <= default_lang < len(compilers):
+        console.print(
+            f"[bold cyan]Default Compiler:[/bold cyan] {compilers[default_lang].compiler_name}"
+        )
+
+    # Show problems
+    if problems:
+        console.print(f"\n[bold cyan]Available Problems:[/bold cyan]")
+        table = fill_table(
+            make_problems_table(),
+            [(problem.problem_id, problem.problem_name) for problem in problems],
+        )
+
+        console.print(table)
+    else:
+        console.print("[yellow]No problems found in this contest.[/yellow]")
+
+    # Show compilers
+    if compilers:
+        console.print(f"\n[bold cyan]Available Compilers:[/bold cyan]")
+        table = fill_table(
+            make_compilers_table(),
+            [
+                (
+                    f"{idx + 1} *" if idx == default_lang else str(idx + 1),
+                    compiler.compiler_lang,
+                    compiler.compiler_name,
+                )
+                for idx, compiler in enumerate(compilers)
+            ],
+        )
+
+        console.print(table)
+    else:
+        console.print("[yellow]No compilers found in this contest.[/yellow]")
+
+
+cmd = contest_show
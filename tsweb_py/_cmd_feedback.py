@@ -0,0 +1,34 @@
+"""`tsweb_py feedback` command."""
+
+import click
+
+from .cli import get_client
+from .utils.terminal import fill_table, get_console, make_tests_table, test_row
+
+
+@click.command()
+@click.argument("submission_id", type=str)
+@click.pass_obj
+def feedback(obj: dict, submission_id: str):
+    """Show detailed test results for a specific submission."""
+    console = get_console()
+    client = get_client(obj)
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    console.print(f"[cyan]Fetching feedback for submission {submission_id}...[/cyan]")
+    tests = client.get_feedback(submission_id)
+
+    if tests:
+        console.print(f"\n[bold cyan]Test Results for Submission {submission_id}:[/bold cyan]")
+        table = fill_table(make_tests_table(), map(test_row, tests))
+
+        console.print(table)
+    else:
+        console.print("[yellow]No test results found for this submission.[/yellow]")
+
+
+cmd = feedback
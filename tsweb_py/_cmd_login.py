@@ -0,0 +1,16 @@
+"""`tsweb_py login` command."""
+
+import click
+
+from .cli import get_client
+
+
+@click.command()
+@click.pass_obj
+def login(obj: dict):
+    """Save TestSys credentials for future use."""
+    client = get_client(obj)
+    client.login()
+
+
+cmd = login
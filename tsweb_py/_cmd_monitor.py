@@ -0,0 +1,215 @@
+"""`tsweb_py contest monitor` command."""
+
+from datetime import datetime
+
+import click
+
+from .cli import get_client
+from .utils.terminal import get_console, make_monitor_table
+
+
+@click.command(name="monitor")
+@click.pass_obj
+def contest_monitor(obj: dict):
+    """Display contest leaderboard (monitor)."""
+    from bs4 import BeautifulSoup
+    
+    console = get_console()
+    client = get_client(obj)
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    console.print("[cyan]Fetching monitor...[/cyan]")
+    html = client.get_monitor_html()
+    
+    # Parse HTML with BeautifulSoup
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Extract contest timing information
+    page_text = soup.get_text()
+    lines = page_text.split('\n')
+    
+    contest_info = {}
+    for line in lines:
+        line = line.strip()
+        if line.startswith("Started at:"):
+            contest_info["started"] = line.replace("Started at:", "").strip()
+        elif line.startswith("Duration:"):
+            contest_info["duration"] = line.replace("Duration:", "").strip()
+        elif line.startswith("Will finish at:"):
+            contest_info["finish"] = line.replace("Will finish at:", "").strip()
+        elif line.startswith("State:"):
+            contest_info["state"] = line.replace("State:", "").strip()
+        elif line.startswith("Last updated:"):
+            contest_info["updated"] = line.replace("Last updated:", "").strip()
+    
+    # Display contest info before the table
+    if contest_info:
+        console.print("\n[bold cyan]Contest Information:[/bold cyan]")
+        if "started" in contest_info:
+            console.print(f"[bold]Started:[/bold] {contest_info['started']}")
+        if "duration" in contest_info:
+            console.print(f"[bold]Duration:[/bold] {contest_info['duration']}")
+        if "finish" in contest_info:
+            finish_str = contest_info['finish']
+            console.print(f"[bold]Finishes:[/bold] [yellow]{finish_str}[/yellow]")
+            
+            # Try to parse finish time and calculate time remaining
+            try:
+                # Format: "20.02.2026 23:59:00 UTC" or similar
+                # Remove "UTC" suffix if present
+                finish_clean = finish_str.replace(" UTC", "").strip()
+                finish_time = datetime.strptime(finish_clean, "%d.%m.%Y %H:%M:%S")
+                
+                now = datetime.now()
+                time_left = finish_time - now
+                
+                if time_left.total_seconds() > 0:
+                    # Calculate days, hours, minutes
+                    days = time_left.days
+                    hours, remainder = divmod(time_left.seconds, 3600)
+                    minutes, _ = divmod(remainder, 60)
+                    
+                    # Format time remaining
+                    parts = []
+                    if days > 0:
+                        parts.append(f"{days}d")
+                    if hours > 0:
+                        parts.append(f"{hours}h")
+                    if minutes > 0 or not parts:
+                        parts.append(f"{minutes}m")
+                    
+                    time_str = " ".join(parts)
+                    console.print(f"[bold]Time Remaining:[/bold] [green]{time_str}[/green]")
+                else:
+                    console.print(f"[bold]Time Remaining:[/bold] [red]Contest ended[/red]")
+            except (ValueError, AttributeError):
+                # If parsing fails, just skip time remaining
+                pass
+        
+        if "state" in contest_info:
+            # Color code the state
+            state = contest_info["state"]
+            if state == "RUNNING":
+                state_colored = f"[green]{state}[/green]"
+            elif state == "RESULTS":
+                state_colored = f"[blue]{state}[/blue]"
+            elif state == "FROZEN":
+                state_colored = f"[cyan]{state}[/cyan]"
+            else:
+                state_colored = state
+            console.print(f"[bold]State:[/bold] {state_colored}")
+        if "updated" in contest_info:
+            console.print(f"[dim]Last updated: {contest_info['updated']}[/dim]")
+        console.print()  # Empty line before table
+    
+    # Find the main table (TABLE with class=mtab)
+    monitor_table = soup.find('table', class_='mtab')
+    
+    if not monitor_table:
+        console.print("[red]Monitor table not found.[/red]")
+        return
+    
+    # Find all rows
+    rows = monitor_table.find_all('tr')
+    
+    if not rows:
+        console.print("[red]No data found in monitor table.[/red]")
+        return
+    
+    # First row is the header with problem IDs
+    header_row = rows[0]
+    headers = []
+    problem_headers = []
+    
+    for th in header_row.find_all('th'):
+        text = th.get_text(strip=True)
+        headers.append(text)
+        # Problem headers are links with problem IDs like "17A", "17B", etc.
+        link = th.find('a')
+        if link:
+            problem_headers.append(link.get_text(strip=True))
+    
+    # Create Rich table
+    table = make_monitor_table(headers)
+    
+    # Process data rows (skip header and statistics rows at the end)
+    for row in rows[1:]:
+        # Check if this is a statistics row (Submits/Accepted/Rejected/Frozen)
+        first_cell = row.find('td')
+        if first_cell:
+            first_class = first_cell.get('class')
+            if first_class and isinstance(first_class, list):
+                # Skip statistics rows - they have class 'no', 'ok', 'wa', or 'fz' on first cell
+                if 'no' in first_class or 'ok' in first_class or 'wa' in first_class or 'fz' in first_class:
+                    continue
+        
+        cells = row.find_all('td')
+        if not cells or len(cells) < 3:
+            continue
+        
+        row_data = []
+        for idx, cell in enumerate(cells):
+            # Skip the first cell (ID column)
+            if idx == 0:
+                continue
+                
+            cell_class = cell.get('class')
+            if cell_class is None:
+                cell_class = []
+            elif isinstance(cell_class, str):
+                cell_class = [cell_class]
+            
+            # For problem cells (ok/wa/no), extract just the +/- and attempt count
+            # Use stripped_strings which splits on <BR> tags automatically
+            # Format: ['+1', '1.15:57'] or ['+', '2.16:21'] or ['-1', '3.21:18'] or ['.']
+            if 'ok' in cell_class or 'firstokeven' in cell_class or 'firstokodd' in cell_class:
+                # Accepted solution - extract just the +N part (first string)
+                strings = list(cell.stripped_strings)
+                if strings:
+                    result = strings[0]  # e.g., "+1" or "+"
+                    row_data.append(f"[green]{result}[/green]")
+                else:
+                    row_data.append(f"[green]?[/green]")
+            elif 'wa' in cell_class:
+                # Wrong answer - extract just the -N part (first string)
+                strings = list(cell.stripped_strings)
+                if strings:
+                    result = strings[0]  # e.g., "-1" or "-2"
+                    row_data.append(f"[red]{result}[/red]")
+                else:
+                    row_data.append(f"[red]?[/red]")
+            elif 'no' in cell_class:
+                # Not attempted - just show the dot
+                cell_text = cell.get_text(strip=True)
+                row_data.append(f"[dim]{cell_text}[/dim]")
+            elif 'solv' in cell_class:
+                # Solved count - green bold
+                cell_text = cell.get_text(strip=True)
+                row_data.append(f"[bold green]{cell_text}[/bold green]")
+            elif 'pen' in cell_class:
+                # Penalty time - yellow
+                cell_text = cell.get_text(strip=True)
+                row_data.append(f"[yellow]{cell_text}[/yellow]")
+            elif 'rk' in cell_class:
+                # Rank - cyan bold
+                cell_text = cell.get_text(strip=True)
+                row_data.append(f"[bold cyan]{cell_text}[/bold cyan]")
+            elif 'for' in cell_class:
+                # Current user's team - highlight with bold magenta
+                cell_text = cell.get_text(strip=True)
+                row_data.append(f"[bold magenta]{cell_text}[/bold magenta]")
+            else:
+                cell_text = cell.get_text(strip=True)
+                row_data.append(cell_text)
+        
+        if row_data:
+            table.add_row(*row_data)
+    
+    console.print(table)
+
+
+cmd = contest_monitor
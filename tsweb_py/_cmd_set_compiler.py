@@ -0,0 +1,64 @@
+"""`tsweb_py set-compiler` command."""
+
+import click
+
+from .cli import get_client, get_local_config
+from .utils.terminal import choose_index, fill_table, get_console, make_compilers_table
+
+
+@click.command(name="set-compiler")
+@click.pass_obj
+def set_compiler(obj: dict):
+    """Choose default compiler/language."""
+    from .config import LocalConfig
+
+    console = get_console()
+    client = get_client(obj)
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    # Fetch compilers from site
+    console.print("[cyan]Fetching compilers...[/cyan]")
+    compilers = client.get_compilers()
+
+    if not compilers:
+        console.print("[red]No compilers found in this contest.[/red]")
+        return
+
+    # Load current default
+    config = get_local_config(obj)
+    if config is None:
+        config = LocalConfig()
+
+    # Display compilers
+    table = fill_table(
+        make_compilers_table("Available Compilers"),
+        [
+            (
+                f"{idx + 1} *" if idx == config.default_lang else str(idx + 1),
+                compiler.compiler_lang,
+                compiler.compiler_name,
+            )
+            for idx, compiler in enumerate(compilers)
+        ],
+    )
+
+    console.print(table)
+
+    # Let user choose
+    idx = choose_index("Select default compiler", compilers)
+    if idx is None:
+        return
+
+    config.default_lang = idx
+    config.save()
+
+    console.print(
+        f"[green]Default compiler set to: {compilers[idx].compiler_name}[/green]"
+    )
+
+
+cmd = set_compiler
@@ -0,0 +1,66 @@
+"""`tsweb_py set-contest` command."""
+
+import click
+
+from .cli import get_client, get_local_config
+from .utils.terminal import choose_index, fill_table, get_console, make_contests_table
+
+
+@click.command(name="set-contest")
+@click.pass_obj
+def set_contest(obj: dict):
+    """Select and configure a contest."""
+    from .config import LocalConfig
+
+    console = get_console()
+    client = get_client(obj)
+
+    # Auto-login if credentials saved
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    # Fetch available contests
+    console.print("[cyan]Fetching available contests...[/cyan]")
+    contests = client.get_available_contests()
+
+    if not contests:
+        console.print("[red]No contests found.[/red]")
+        return
+
+    # Display contests (reversed: newest at bottom, oldest at top)
+    # Reverse display order but keep original numbering
+    table = fill_table(
+        make_contests_table(),
+        [
+            (str(idx + 1), contest.id, contest.name, contest.status)
+            for idx, contest in reversed(list(enumerate(contests)))
+        ],
+    )
+
+    console.print(table)
+
+    # Let user choose
+    idx = choose_index("Select contest", contests)
+    if idx is None:
+        return
+
+    selected = contests[idx]
+
+    # Change to selected contest
+    if not client.change_contest(selected.id):
+        return
+
+    # Create or update local config (without contest field - it's in cookies).
+    # It is written to the current directory, carrying over settings found in a
+    # parent directory; a malformed config is replaced with defaults
+    config = get_local_config(obj)
+    if config is None:
+        config = LocalConfig()
+    config.save()
+
+    console.print(f"[green]Switched to contest: {selected.name}[/green]")
+
+
+cmd = set_contest
@@ -0,0 +1,29 @@
+"""`tsweb_py contest statements` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from .cli import get_client
+from .utils.terminal import get_console
+
+
+@click.command(name="statements")
+@click.option("-o", "--output", type=click.Path(path_type=Path), help="Output file path")
+@click.pass_obj
+def contest_statements(obj: dict, output: Optional[Path]):
+    """Download contest statements PDF."""
+    console = get_console()
+    client = get_client(obj)
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    console.print("[cyan]Fetching statements...[/cyan]")
+    client.download_statements(output)
+
+
+cmd = contest_statements
@@ -0,0 +1,33 @@
+"""`tsweb_py submissions` command."""
+
+import click
+
+from .cli import get_client
+from .utils.terminal import fill_table, get_console, make_submissions_table, submission_row
+
+
+@click.command()
+@click.pass_obj
+def submissions(obj: dict):
+    """Show all submissions."""
+    console = get_console()
+    client = get_client(obj)
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    console.print("[cyan]Fetching submissions...[/cyan]")
+    subs = client.get_all_submissions(limit=20)  # Show last 20
+
+    if not subs:
+        console.print("[yellow]No submissions found.[/yellow]")
+        return
+
+    table = fill_table(make_submissions_table("Submissions"), map(submission_row, subs))
+
+    console.print(table)
+
+
+cmd = submissions
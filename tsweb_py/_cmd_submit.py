@@ -0,0 +1,292 @@
+"""`tsweb_py contest submit` command and submission watcher."""
+
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from .cli import get_client, get_local_config
+from .utils.terminal import (
+    choose_index,
+    fill_table,
+    format_result_color,
+    get_console,
+    make_problems_table,
+    make_tests_table,
+    test_row,
+)
+
+if TYPE_CHECKING:
+    from .client import TestSysClient
+
+
+# Results meaning the submission is still queued or being judged
+_PENDING_RESULTS = frozenset(("NO", "JUDGING", "PENDING", ""))
+
+
+def _debug_log(console):
+    """Return log(msg, *args): prints msg, str.format-ed with args if any."""
+
+    def log(msg: str, *args) -> None:
+        console.print(msg.format(*args) if args else msg)
+
+    return log
+
+
+def _no_log(msg: str, *args) -> None:
+    """Stand-in for the debug log when debug output is off; never formats msg."""
+
+
+@click.command(name="submit")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("-p", "--problem", help="Problem ID (skip interactive selection)")
+@click.option("-l", "--lang", type=int, help="Compiler index (default: from config)")
+@click.option(
+    "-w",
+    "--watch",
+    is_flag=True,
+    default=True,
+    help="Watch submission results (default: true)",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    default=False,
+    help="Enable debug output",
+)
+@click.pass_obj
+def contest_submit(
+    obj: dict, file: str, problem: Optional[str], lang: Optional[int], watch: bool, debug: bool
+):
+    """Submit a solution file."""
+    console = get_console()
+    client = get_client(obj)
+    log = _debug_log(console) if debug else _no_log
+
+    if not client.auto_login():
+        console.print("[yellow]Not logged in. Please login first.[/yellow]")
+        if not client.login():
+            return
+
+    # Determine problem ID
+    if problem is None:
+        # Fetch problems and show interactive selection
+        console.print("[cyan]Fetching problems...[/cyan]")
+        problems = client.get_problems()
+        
+        if not problems:
+            console.print("[red]No problems found in this contest.[/red]")
+            return
+        
+        # Display problems table
+        table = fill_table(
+            make_problems_table("Available Problems", numbered=True),
+            [
+                (str(idx + 1), prob.problem_id, prob.problem_name)
+                for idx, prob in enumerate(problems)
+            ],
+        )
+        
+        console.print(table)
+        
+        # Let user choose
+        idx = choose_index("Select problem", problems)
+        if idx is None:
+            return
+        
+        problem = problems[idx].problem_id
+
+    log("[cyan]DEBUG: Problem ID = {}[/cyan]", problem)
+    log("[cyan]DEBUG: File path = {}[/cyan]", file)
+
+    # Fetch compilers from site
+    log("[cyan]DEBUG: Fetching compilers from site...[/cyan]")
+    
+    compilers = client.get_compilers()
+    if not compilers:
+        console.print("[red]No compilers found in this contest.[/red]")
+        return
+
+    log("[cyan]DEBUG: Found {} compilers[/cyan]", len(compilers))
+
+    # Determine compiler
+    if lang is None:
+        # Load default from local config
+        config = get_local_config(obj)
+        lang = config.default_lang if config else 0
+        log("[cyan]DEBUG: Using default compiler index: {}[/cyan]", lang)
+
+    if not (0 <= lang < len(compilers)):
+        console.print(f"[red]Invalid compiler index: {lang}[/red]")
+        console.print(f"[yellow]Available compilers: 0-{len(compilers)-1}[/yellow]")
+        return
+
+    compiler = compilers[lang]
+    
+    log(
+        "[cyan]DEBUG: Selected compiler: {}: {} (ID: {})[/cyan]",
+        compiler.compiler_lang,
+        compiler.compiler_name,
+        compiler.compiler_id,
+    )
+
+    # Submit
+    if not client.submit(problem, compiler.compiler_id, file):
+        return
+
+    # Watch results if requested
+    if watch:
+        watch_submission(client, debug, submission_id=client.last_submission_id)
+
+
+def watch_submission(
+    client: "TestSysClient", debug: bool = False, submission_id: Optional[str] = None
+):
+    """
+    Poll and display submission results in real-time.
+    Watches `submission_id` if given, otherwise the latest submission.
+    """
+    console = get_console()
+    # Debug output goes through log, a no-op unless debugging. Values are passed
+    # as arguments so messages are only formatted when actually printed
+    log = _debug_log(console) if debug else _no_log
+    console.print("\n[cyan]Watching submission...[/cyan]")
+
+    # An ID taken from the submit response may still be missing from the list;
+    # the first poll then falls back to the latest submission
+    fallback_to_latest = submission_id is not None
+
+    if submission_id is None:
+        # Get latest submission ID
+        log("[cyan]DEBUG: Fetching latest submission to get its ID...[/cyan]")
+
+        submissions = client.get_all_submissions(debug=debug, limit=1)
+
+        log("[cyan]DEBUG: Received {} submissions[/cyan]", len(submissions))
+        if submissions:
+            latest = submissions[0]
+            log("[cyan]DEBUG: Latest submission ID: {}[/cyan]", latest.id)
+            log("[cyan]DEBUG: Latest submission problem: {}[/cyan]", latest.problem)
+            log("[cyan]DEBUG: Latest submission compiler: {}[/cyan]", latest.compiler)
+            log("[cyan]DEBUG: Latest submission result: {}[/cyan]", latest.result)
+
+        if not submissions:
+            console.print("[red]No submissions found[/red]")
+            log("[cyan]DEBUG: get_all_submissions() returned empty list[/cyan]")
+            return
+
+        submission_id = submissions[0].id
+
+    log("[cyan]DEBUG: Tracking submission ID: {}[/cyan]", submission_id)
+
+    # Poll until judging complete
+    poll_count = 0
+    last_result = None
+    # Poll with exponential backoff: fast first checks, fewer requests on slow judging
+    POLL_DELAY_MIN = 0.25
+    POLL_DELAY_MAX = 2.0
+    # If the result doesn't change for this many seconds, assume it's final
+    STUCK_TIMEOUT = 30.0
+    delay = POLL_DELAY_MIN
+    last_change = time.monotonic()
+    stuck_reported = False
+
+    # Don't use status spinner in debug mode - it can interfere with debug output and cause hangs
+    if debug:
+        log("[cyan]Starting polling loop (debug mode - no spinner)...[/cyan]")
+        status = nullcontext()
+    else:
+        status = console.status("[bold green]Judging...")
+
+    with status:
+        while True:
+            poll_count += 1
+
+            if poll_count % 10 == 0:
+                log("[cyan]DEBUG: Poll #{}, still waiting...[/cyan]", poll_count)
+
+            # Fetch current state of the tracked submission
+            current = client.get_submission(submission_id, debug=debug)
+
+            if current is None and fallback_to_latest:
+                log(
+                    "[yellow]DEBUG: Submission {} not listed, watching the latest submission instead[/yellow]",
+                    submission_id,
+                )
+                submissions = client.get_all_submissions(debug=debug, limit=1)
+                if submissions:
+                    current = submissions[0]
+                    submission_id = current.id
+            fallback_to_latest = False
+
+            if current is None:
+                console.print("[red]Submission not found[/red]")
+                log("[cyan]DEBUG: Submission {} not found in latest submissions[/cyan]", submission_id)
+                return
+
+            result_upper = current.result.upper()
+
+            if poll_count <= 3 or current.result != last_result:
+                log(
+                    "[cyan]DEBUG: Poll #{} - Result: '{}' (upper: '{}')[/cyan]",
+                    poll_count,
+                    current.result,
+                    result_upper,
+                )
+                if last_result is not None and current.result != last_result:
+                    log(
+                        "[yellow]DEBUG: Result changed from '{}' to '{}'[/yellow]",
+                        last_result,
+                        current.result,
+                    )
+
+            # Judging is active while the result moves: poll fast again
+            if current.result != last_result:
+                last_result = current.result
+                last_change = time.monotonic()
+                delay = POLL_DELAY_MIN
+                stuck_reported = False
+
+            stuck = time.monotonic() - last_change > STUCK_TIMEOUT
+            if stuck and not stuck_reported:
+                log("[yellow]DEBUG: Result hasn't changed for {:.0f} seconds[/yellow]", STUCK_TIMEOUT)
+                log("[yellow]DEBUG: Assuming '{}' is the final result[/yellow]", current.result)
+                stuck_reported = True
+
+            # Check if judging is complete
+            if result_upper not in _PENDING_RESULTS:
+                log("[cyan]DEBUG: Judging complete! Final result: {}[/cyan]", current.result)
+                break
+
+            # If result is stuck on "NO" for too long, assume it's final
+            # Some contests might not update the result field properly
+            if result_upper == "NO" and stuck:
+                log("[yellow]DEBUG: Breaking out - result stuck on 'NO' for too long[/yellow]")
+                log("[yellow]DEBUG: This might be a contest-specific behavior[/yellow]")
+                break
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, POLL_DELAY_MAX)
+
+    # Display final result
+    console.print(f"\n[bold]Result:[/bold] {format_result_color(current.result)}")
+    console.print(f"[bold]Time:[/bold] {current.time}")
+
+    # Fetch detailed feedback
+    log("[cyan]DEBUG: Fetching feedback for submission {}...[/cyan]", submission_id)
+    
+    tests = client.get_feedback(submission_id)
+    
+    log("[cyan]DEBUG: Received {} test results[/cyan]", len(tests))
+
+    if tests:
+        console.print("\n[bold cyan]Test Results:[/bold cyan]")
+        table = fill_table(make_tests_table(), map(test_row, tests))
+
+        console.print(table)
+    else:
+        console.print("[yellow]No detailed test results available.[/yellow]")
+
+
+cmd = contest_submit
@@ -0,0 +1,7 @@
+"""Compatibility helpers for the range of supported Python versions."""
+
+import sys
+
+# Keyword arguments for @dataclass: slots=True is only accepted on Python 3.10+,
+# older interpreters fall back to regular __dict__-backed instances.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
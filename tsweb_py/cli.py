@@ -1,905 +1,98 @@
 """Command-line interface for tsweb_py."""
 
-import time
-from pathlib import Path
-from typing import Optional
-from datetime import datetime
+import importlib
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .client import TestSysClient
-from .config import LocalConfig
-from .utils.terminal import choose_index, format_result_color
-
-
-console = Console()
-
-
-@click.group()
+if TYPE_CHECKING:
+    from .client import TestSysClient
+    from .config import LocalConfig
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules only when they are needed.
+    Maps command names to modules in this package exposing a `cmd` attribute.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, name):
+        if name in self.lazy_subcommands:
+            module = importlib.import_module(f".{self.lazy_subcommands[name]}", __package__)
+            return module.cmd
+        return super().get_command(ctx, name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "login": "_cmd_login",
+        "set-contest": "_cmd_set_contest",
+        "set-compiler": "_cmd_set_compiler",
+        "info": "_cmd_info",
+        "submissions": "_cmd_submissions",
+        "feedback": "_cmd_feedback",
+        "get-submit": "_cmd_get_submit",
+    },
+)
 @click.version_option(version="1.0.0")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """tsweb_py - CLI client for TestSys online judge system."""
-    pass
-
-
-@cli.command()
-def login():
-    """Save TestSys credentials for future use."""
-    client = TestSysClient()
-    client.login()
-
-
-@cli.group()
+    # Per-invocation state shared by subcommands (see get_local_config)
+    ctx.ensure_object(dict)
+
+
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "show": "_cmd_contest_show",
+        "statements": "_cmd_statements",
+        "monitor": "_cmd_monitor",
+        "submit": "_cmd_submit",
+    },
+)
 def contest():
     """Manage contest information."""
     pass
 
 
-@contest.command(name="show")
-def contest_show():
-    """Display current contest information, problems and compilers."""
-    client = TestSysClient()
-    
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    # Show current contest and user info
-    user_info = client.get_user_info()
-    if "contest" in user_info:
-        console.print(
-            f"\n[bold cyan]Current Contest:[/bold cyan] {user_info['contest']}"
-        )
-    if "name" in user_info:
-        console.print(f"[bold cyan]User:[/bold cyan] {user_info['name']}")
-
-    # Fetch problems and compilers from site
-    console.print("\n[cyan]Fetching problems and compilers...[/cyan]")
-    problems = client.get_problems()
-    compilers = client.get_compilers()
-
-    # Load default compiler index from local config
-    config = LocalConfig.load()
-    default_lang = config.default_lang if config else 0
-
-    # Show default compiler
-    if compilers and 0 <= default_lang < len(compilers):
-        console.print(
-            f"[bold cyan]Default Compiler:[/bold cyan] {compilers[default_lang].compiler_name}"
-        )
-
-    # Show problems
-    if problems:
-        console.print(f"\n[bold cyan]Available Problems:[/bold cyan]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="white")
-
-        for problem in problems:
-            table.add_row(problem.problem_id, problem.problem_name)
-
-        console.print(table)
-    else:
-        console.print("[yellow]No problems found in this contest.[/yellow]")
-
-    # Show compilers
-    if compilers:
-        console.print(f"\n[bold cyan]Available Compilers:[/bold cyan]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("#", style="cyan")
-        table.add_column("Language", style="yellow")
-        table.add_column("Name", style="white")
-
-        for idx, compiler in enumerate(compilers):
-            marker = " *" if idx == default_lang else ""
-            table.add_row(
-                f"{idx + 1}{marker}", compiler.compiler_lang, compiler.compiler_name
-            )
-
-        console.print(table)
-    else:
-        console.print("[yellow]No compilers found in this contest.[/yellow]")
-
-
-@cli.command(name="set-contest")
-def set_contest():
-    """Select and configure a contest."""
-    client = TestSysClient()
-
-    # Auto-login if credentials saved
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    # Fetch available contests
-    console.print("[cyan]Fetching available contests...[/cyan]")
-    contests = client.get_available_contests()
-
-    if not contests:
-        console.print("[red]No contests found.[/red]")
-        return
-
-    # Display contests (reversed: newest at bottom, oldest at top)
-    table = Table(
-        title="Available Contests", show_header=True, header_style="bold cyan"
-    )
-    table.add_column("#", style="cyan")
-    table.add_column("ID", style="yellow")
-    table.add_column("Name", style="white")
-    table.add_column("Status", style="magenta")
-
-    # Reverse display order but keep original numbering
-    for idx, contest in enumerate(reversed(contests)):
-        # Calculate original index (before reversal)
-        original_idx = len(contests) - idx - 1
-        table.add_row(str(original_idx + 1), contest.id, contest.name, contest.status)
-
-    console.print(table)
-
-    # Let user choose
-    idx = choose_index("Select contest", contests)
-    if idx is None:
-        return
-
-    selected = contests[idx]
-
-    # Change to selected contest
-    if not client.change_contest(selected.id):
-        return
-
-    # Create or update local config (without contest field - it's in cookies)
-    config = LocalConfig.load()
-    if config is None:
-        config = LocalConfig()
-    config.save()
-
-    console.print(f"[green]Switched to contest: {selected.name}[/green]")
-
-
-@cli.command(name="set-compiler")
-def set_compiler():
-    """Choose default compiler/language."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    # Fetch compilers from site
-    console.print("[cyan]Fetching compilers...[/cyan]")
-    compilers = client.get_compilers()
-
-    if not compilers:
-        console.print("[red]No compilers found in this contest.[/red]")
-        return
-
-    # Load current default
-    config = LocalConfig.load()
-    if config is None:
-        config = LocalConfig()
-
-    # Display compilers
-    table = Table(
-        title="Available Compilers", show_header=True, header_style="bold cyan"
-    )
-    table.add_column("#", style="cyan")
-    table.add_column("Language", style="yellow")
-    table.add_column("Name", style="white")
-
-    for idx, compiler in enumerate(compilers):
-        marker = " *" if idx == config.default_lang else ""
-        table.add_row(f"{idx + 1}{marker}", compiler.compiler_lang, compiler.compiler_name)
-
-    console.print(table)
-
-    # Let user choose
-    idx = choose_index("Select default compiler", compilers)
-    if idx is None:
-        return
-
-    config.default_lang = idx
-    config.save()
-
-    console.print(
-        f"[green]Default compiler set to: {compilers[idx].compiler_name}[/green]"
-    )
-
-
-@contest.command(name="statements")
-@click.option("-o", "--output", type=click.Path(path_type=Path), help="Output file path")
-def contest_statements(output: Optional[Path]):
-    """Download contest statements PDF."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    console.print("[cyan]Fetching statements...[/cyan]")
-    client.download_statements(output)
-
-
-@contest.command(name="monitor")
-def contest_monitor():
-    """Display contest leaderboard (monitor)."""
-    from bs4 import BeautifulSoup
-    
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    console.print("[cyan]Fetching monitor...[/cyan]")
-    html = client.get_monitor_html()
-    
-    # Parse HTML with BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Extract contest timing information
-    page_text = soup.get_text()
-    lines = page_text.split('\n')
-    
-    contest_info = {}
-    for line in lines:
-        line = line.strip()
-        if line.startswith("Started at:"):
-            contest_info["started"] = line.replace("Started at:", "").strip()
-        elif line.startswith("Duration:"):
-            contest_info["duration"] = line.replace("Duration:", "").strip()
-        elif line.startswith("Will finish at:"):
-            contest_info["finish"] = line.replace("Will finish at:", "").strip()
-        elif line.startswith("State:"):
-            contest_info["state"] = line.replace("State:", "").strip()
-        elif line.startswith("Last updated:"):
-            contest_info["updated"] = line.replace("Last updated:", "").strip()
-    
-    # Display contest info before the table
-    if contest_info:
-        console.print("\n[bold cyan]Contest Information:[/bold cyan]")
-        if "started" in contest_info:
-            console.print(f"[bold]Started:[/bold] {contest_info['started']}")
-        if "duration" in contest_info:
-            console.print(f"[bold]Duration:[/bold] {contest_info['duration']}")
-        if "finish" in contest_info:
-            finish_str = contest_info['finish']
-            console.print(f"[bold]Finishes:[/bold] [yellow]{finish_str}[/yellow]")
-            
-            # Try to parse finish time and calculate time remaining
-            try:
-                # Format: "20.02.2026 23:59:00 UTC" or similar
-                # Remove "UTC" suffix if present
-                finish_clean = finish_str.replace(" UTC", "").strip()
-                finish_time = datetime.strptime(finish_clean, "%d.%m.%Y %H:%M:%S")
-                
-                now = datetime.now()
-                time_left = finish_time - now
-                
-                if time_left.total_seconds() > 0:
-                    # Calculate days, hours, minutes
-                    days = time_left.days
-                    hours, remainder = divmod(time_left.seconds, 3600)
-                    minutes, _ = divmod(remainder, 60)
-                    
-                    # Format time remaining
-                    parts = []
-                    if days > 0:
-                        parts.append(f"{days}d")
-                    if hours > 0:
-                        parts.append(f"{hours}h")
-                    if minutes > 0 or not parts:
-                        parts.append(f"{minutes}m")
-                    
-                    time_str = " ".join(parts)
-                    console.print(f"[bold]Time Remaining:[/bold] [green]{time_str}[/green]")
-                else:
-                    console.print(f"[bold]Time Remaining:[/bold] [red]Contest ended[/red]")
-            except (ValueError, AttributeError):
-                # If parsing fails, just skip time remaining
-                pass
-        
-        if "state" in contest_info:
-            # Color code the state
-            state = contest_info["state"]
-            if state == "RUNNING":
-                state_colored = f"[green]{state}[/green]"
-            elif state == "RESULTS":
-                state_colored = f"[blue]{state}[/blue]"
-            elif state == "FROZEN":
-                state_colored = f"[cyan]{state}[/cyan]"
-            else:
-                state_colored = state
-            console.print(f"[bold]State:[/bold] {state_colored}")
-        if "updated" in contest_info:
-            console.print(f"[dim]Last updated: {contest_info['updated']}[/dim]")
-        console.print()  # Empty line before table
-    
-    # Find the main table (TABLE with class=mtab)
-    monitor_table = soup.find('table', class_='mtab')
-    
-    if not monitor_table:
-        console.print("[red]Monitor table not found.[/red]")
-        return
-    
-    # Find all rows
-    rows = monitor_table.find_all('tr')
-    
-    if not rows:
-        console.print("[red]No data found in monitor table.[/red]")
-        return
-    
-    # First row is the header with problem IDs
-    header_row = rows[0]
-    headers = []
-    problem_headers = []
-    
-    for th in header_row.find_all('th'):
-        text = th.get_text(strip=True)
-        headers.append(text)
-        # Problem headers are links with problem IDs like "17A", "17B", etc.
-        link = th.find('a')
-        if link:
-            problem_headers.append(link.get_text(strip=True))
-    
-    # Create Rich table
-    from rich.table import Table
-    table = Table(title="Contest Monitor", show_header=True, header_style="bold cyan", border_style="blue")
-    
-    # Add columns based on headers
-    for header in headers:
-        if header == "ID":
-            # Skip ID column - we'll skip it in data too
-            continue
-        elif header == "Team":
-            table.add_column(header, style="white", no_wrap=True, overflow="ellipsis", max_width=15)
-        elif header == "=":
-            table.add_column(header, style="green", justify="right", width=2)
-        elif header == "Time":
-            table.add_column(header, style="yellow", justify="right", width=6)
-        elif header == "Rank":
-            table.add_column(header, style="cyan", justify="right", width=4)
-        else:
-            # Problem columns - narrow to fit in 80 columns
-            table.add_column(header, style="magenta", justify="center", width=3, no_wrap=True)
-    
-    # Process data rows (skip header and statistics rows at the end)
-    for row in rows[1:]:
-        # Check if this is a statistics row (Submits/Accepted/Rejected/Frozen)
-        first_cell = row.find('td')
-        if first_cell:
-            first_class = first_cell.get('class')
-            if first_class and isinstance(first_class, list):
-                # Skip statistics rows - they have class 'no', 'ok', 'wa', or 'fz' on first cell
-                if 'no' in first_class or 'ok' in first_class or 'wa' in first_class or 'fz' in first_class:
-                    continue
-        
-        cells = row.find_all('td')
-        if not cells or len(cells) < 3:
-            continue
-        
-        row_data = []
-        for idx, cell in enumerate(cells):
-            # Skip the first cell (ID column)
-            if idx == 0:
-                continue
-                
-            cell_class = cell.get('class')
-            if cell_class is None:
-                cell_class = []
-            elif isinstance(cell_class, str):
-                cell_class = [cell_class]
-            
-            # For problem cells (ok/wa/no), extract just the +/- and attempt count
-            # Use stripped_strings which splits on <BR> tags automatically
-            # Format: ['+1', '1.15:57'] or ['+', '2.16:21'] or ['-1', '3.21:18'] or ['.']
-            if 'ok' in cell_class or 'firstokeven' in cell_class or 'firstokodd' in cell_class:
-                # Accepted solution - extract just the +N part (first string)
-                strings = list(cell.stripped_strings)
-                if strings:
-                    result = strings[0]  # e.g., "+1" or "+"
-                    row_data.append(f"[green]{result}[/green]")
-                else:
-                    row_data.append(f"[green]?[/green]")
-            elif 'wa' in cell_class:
-                # Wrong answer - extract just the -N part (first string)
-                strings = list(cell.stripped_strings)
-                if strings:
-                    result = strings[0]  # e.g., "-1" or "-2"
-                    row_data.append(f"[red]{result}[/red]")
-                else:
-                    row_data.append(f"[red]?[/red]")
-            elif 'no' in cell_class:
-                # Not attempted - just show the dot
-                cell_text = cell.get_text(strip=True)
-                row_data.append(f"[dim]{cell_text}[/dim]")
-            elif 'solv' in cell_class:
-                # Solved count - green bold
-                cell_text = cell.get_text(strip=True)
-                row_data.append(f"[bold green]{cell_text}[/bold green]")
-            elif 'pen' in cell_class:
-                # Penalty time - yellow
-                cell_text = cell.get_text(strip=True)
-                row_data.append(f"[yellow]{cell_text}[/yellow]")
-            elif 'rk' in cell_class:
-                # Rank - cyan bold
-                cell_text = cell.get_text(strip=True)
-                row_data.append(f"[bold cyan]{cell_text}[/bold cyan]")
-            elif 'for' in cell_class:
-                # Current user's team - highlight with bold magenta
-                cell_text = cell.get_text(strip=True)
-                row_data.append(f"[bold magenta]{cell_text}[/bold magenta]")
-            else:
-                cell_text = cell.get_text(strip=True)
-                row_data.append(cell_text)
-        
-        if row_data:
-            table.add_row(*row_data)
-    
-    console.print(table)
-
-
-@contest.command(name="submit")
-@click.argument("file", type=click.Path(exists=True, path_type=Path))
-@click.option("-p", "--problem", help="Problem ID (skip interactive selection)")
-@click.option("-l", "--lang", type=int, help="Compiler index (default: from config)")
-@click.option(
-    "-w",
-    "--watch",
-    is_flag=True,
-    default=True,
-    help="Watch submission results (default: true)",
-)
-@click.option(
-    "--debug",
-    is_flag=True,
-    default=False,
-    help="Enable debug output",
-)
-def contest_submit(file: Path, problem: Optional[str], lang: Optional[int], watch: bool, debug: bool):
-    """Submit a solution file."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    # Determine problem ID
-    if problem is None:
-        # Fetch problems and show interactive selection
-        console.print("[cyan]Fetching problems...[/cyan]")
-        problems = client.get_problems()
-        
-        if not problems:
-            console.print("[red]No problems found in this contest.[/red]")
-            return
-        
-        # Display problems table
-        table = Table(
-            title="Available Problems", show_header=True, header_style="bold cyan"
-        )
-        table.add_column("#", style="cyan")
-        table.add_column("ID", style="yellow")
-        table.add_column("Name", style="white")
-        
-        for idx, prob in enumerate(problems):
-            table.add_row(str(idx + 1), prob.problem_id, prob.problem_name)
-        
-        console.print(table)
-        
-        # Let user choose
-        idx = choose_index("Select problem", problems)
-        if idx is None:
-            return
-        
-        problem = problems[idx].problem_id
-
-    if debug:
-        console.print(f"[cyan]DEBUG: Problem ID = {problem}[/cyan]")
-        console.print(f"[cyan]DEBUG: File path = {file}[/cyan]")
-
-    # Fetch compilers from site
-    if debug:
-        console.print("[cyan]DEBUG: Fetching compilers from site...[/cyan]")
-    
-    compilers = client.get_compilers()
-    if not compilers:
-        console.print("[red]No compilers found in this contest.[/red]")
-        return
-
-    if debug:
-        console.print(f"[cyan]DEBUG: Found {len(compilers)} compilers[/cyan]")
-
-    # Determine compiler
-    if lang is None:
-        # Load default from local config
-        config = LocalConfig.load()
-        lang = config.default_lang if config else 0
-        if debug:
-            console.print(f"[cyan]DEBUG: Using default compiler index: {lang}[/cyan]")
-
-    if not (0 <= lang < len(compilers)):
-        console.print(f"[red]Invalid compiler index: {lang}[/red]")
-        console.print(f"[yellow]Available compilers: 0-{len(compilers)-1}[/yellow]")
-        return
-
-    compiler = compilers[lang]
-    
-    if debug:
-        console.print(f"[cyan]DEBUG: Selected compiler: {compiler.compiler_lang}: {compiler.compiler_name} (ID: {compiler.compiler_id})[/cyan]")
-
-    # Submit
-    if not client.submit(problem, compiler.compiler_id, file):
-        return
-
-    # Watch results if requested
-    if watch:
-        watch_submission(client, debug)
-
-
-def watch_submission(client: TestSysClient, debug: bool = False):
-    """Poll and display submission results in real-time."""
-    console.print("\n[cyan]Watching submission...[/cyan]")
-
-    # Get latest submission ID
-    if debug:
-        console.print("[cyan]DEBUG: Fetching all submissions to get latest ID...[/cyan]")
-    
-    submissions = client.get_all_submissions(debug=debug)
-    
-    if debug:
-        console.print(f"[cyan]DEBUG: Received {len(submissions) if submissions else 0} submissions[/cyan]")
-        if submissions:
-            console.print(f"[cyan]DEBUG: Latest submission ID: {submissions[0].id}[/cyan]")
-            console.print(f"[cyan]DEBUG: Latest submission problem: {submissions[0].problem}[/cyan]")
-            console.print(f"[cyan]DEBUG: Latest submission compiler: {submissions[0].compiler}[/cyan]")
-            console.print(f"[cyan]DEBUG: Latest submission result: {submissions[0].result}[/cyan]")
-    
-    if not submissions:
-        console.print("[red]No submissions found[/red]")
-        if debug:
-            console.print("[cyan]DEBUG: get_all_submissions() returned empty list[/cyan]")
-        return
-
-    latest = submissions[0]
-    submission_id = latest.id
-    
-    if debug:
-        console.print(f"[cyan]DEBUG: Tracking submission ID: {submission_id}[/cyan]")
-
-    # Poll until judging complete
-    poll_count = 0
-    last_result = None
-    no_change_count = 0
-    MAX_NO_CHANGE = 20  # If result doesn't change for 10 seconds (20 * 0.5s), assume it's final
-    
-    # Don't use status spinner in debug mode - it can interfere with debug output and cause hangs
-    if debug:
-        console.print("[cyan]Starting polling loop (debug mode - no spinner)...[/cyan]")
-        while True:
-            poll_count += 1
-            
-            if poll_count % 10 == 0:
-                console.print(f"[cyan]DEBUG: Poll #{poll_count}, still waiting...[/cyan]")
-            
-            # Fetch current submissions
-            submissions = client.get_all_submissions(debug=debug)
-            current = next((s for s in submissions if s.id == submission_id), None)
-
-            if current is None:
-                console.print("[red]Submission not found[/red]")
-                console.print(f"[cyan]DEBUG: Submission {submission_id} not found in latest submissions[/cyan]")
-                if submissions:
-                    console.print(f"[cyan]DEBUG: Available submission IDs: {[s.id for s in submissions[:5]]}[/cyan]")
-                return
-            
-            # Show debug info when result changes or first 3 polls
-            if poll_count <= 3 or current.result != last_result:
-                console.print(f"[cyan]DEBUG: Poll #{poll_count} - Result: '{current.result}' (upper: '{current.result.upper()}')[/cyan]")
-                if current.result != last_result and last_result is not None:
-                    console.print(f"[yellow]DEBUG: Result changed from '{last_result}' to '{current.result}'[/yellow]")
-                    no_change_count = 0
-                last_result = current.result
-            
-            # Track if result is stuck
-            if current.result == last_result:
-                no_change_count += 1
-                if no_change_count == MAX_NO_CHANGE:
-                    console.print(f"[yellow]DEBUG: Result hasn't changed for {MAX_NO_CHANGE} polls (~10 seconds)[/yellow]")
-                    console.print(f"[yellow]DEBUG: Assuming '{current.result}' is the final result[/yellow]")
-
-            # Check if judging is complete
-            if current.result.upper() not in ["NO", "JUDGING", "PENDING", ""]:
-                console.print(f"[cyan]DEBUG: Judging complete! Final result: {current.result}[/cyan]")
-                break
-            
-            # If result is stuck on "NO" for too long, assume it's final
-            # Some contests might not update the result field properly
-            if current.result.upper() == "NO" and no_change_count >= MAX_NO_CHANGE:
-                console.print(f"[yellow]DEBUG: Breaking out - result stuck on 'NO' for too long[/yellow]")
-                console.print(f"[yellow]DEBUG: This might be a contest-specific behavior[/yellow]")
-                break
-
-            time.sleep(0.5)
-    else:
-        # Normal mode with status spinner
-        with console.status("[bold green]Judging...") as status:
-            while True:
-                poll_count += 1
-                
-                # Fetch current submissions
-                submissions = client.get_all_submissions(debug=False)
-                current = next((s for s in submissions if s.id == submission_id), None)
-
-                if current is None:
-                    console.print("[red]Submission not found[/red]")
-                    return
-                
-                # Track if result is stuck
-                if current.result == last_result:
-                    no_change_count += 1
-                else:
-                    no_change_count = 0
-                    last_result = current.result
-
-                # Check if judging is complete
-                if current.result.upper() not in ["NO", "JUDGING", "PENDING", ""]:
-                    break
-                
-                # If result is stuck on "NO" for too long, assume it's final
-                # Some contests might not update the result field properly
-                if current.result.upper() == "NO" and no_change_count >= MAX_NO_CHANGE:
-                    break
-
-                time.sleep(0.5)
-
-    # Display final result
-    console.print(f"\n[bold]Result:[/bold] {format_result_color(current.result)}")
-    console.print(f"[bold]Time:[/bold] {current.time}")
-
-    # Fetch detailed feedback
-    if debug:
-        console.print(f"[cyan]DEBUG: Fetching feedback for submission {submission_id}...[/cyan]")
-    
-    tests = client.get_feedback(submission_id)
-    
-    if debug:
-        console.print(f"[cyan]DEBUG: Received {len(tests) if tests else 0} test results[/cyan]")
-
-    if tests:
-        console.print("\n[bold cyan]Test Results:[/bold cyan]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Test", style="cyan")
-        table.add_column("Result", style="white")
-        table.add_column("Time", style="yellow")
-        table.add_column("Memory", style="yellow")
-        table.add_column("Comment", style="white")
-
-        for test in tests:
-            table.add_row(
-                test.test_id,
-                format_result_color(test.result),
-                test.time,
-                test.memory,
-                test.comment,
-            )
-
-        console.print(table)
-    else:
-        console.print("[yellow]No detailed test results available.[/yellow]")
-
-
-@cli.command()
-def info():
-    """Show user information and current contest."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    user_info = client.get_user_info()
-
-    console.print("\n[bold cyan]User Information:[/bold cyan]")
-    if "name" in user_info:
-        console.print(f"[bold]Name:[/bold] {user_info['name']}")
-    if "contest" in user_info:
-        console.print(f"[bold]Current Contest:[/bold] {user_info['contest']}")
-    if "deadline" in user_info:
-        console.print(f"[bold]Contest Deadline:[/bold] [yellow]{user_info['deadline']}[/yellow]")
-        
-        # Show time remaining if deadline_obj is available
-        if "deadline_obj" in user_info:
-            now = datetime.now()
-            deadline = user_info["deadline_obj"]
-            time_left = deadline - now
-            
-            if time_left.total_seconds() > 0:
-                # Calculate days, hours, minutes
-                days = time_left.days
-                hours, remainder = divmod(time_left.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-                
-                # Format time remaining
-                parts = []
-                if days > 0:
-                    parts.append(f"{days}d")
-                if hours > 0:
-                    parts.append(f"{hours}h")
-                if minutes > 0 or not parts:  # Show minutes even if 0 if no other parts
-                    parts.append(f"{minutes}m")
-                
-                time_str = " ".join(parts)
-                console.print(f"[bold]Time Remaining:[/bold] [green]{time_str}[/green]")
-            else:
-                console.print(f"[bold]Time Remaining:[/bold] [red]Contest ended[/red]")
-
-
-@cli.command()
-def submissions():
-    """Show all submissions."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    console.print("[cyan]Fetching submissions...[/cyan]")
-    subs = client.get_all_submissions()
-
-    if not subs:
-        console.print("[yellow]No submissions found.[/yellow]")
-        return
-
-    table = Table(title="Submissions", show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="cyan")
-    table.add_column("Problem", style="yellow")
-    table.add_column("Compiler", style="white")
-    table.add_column("Result", style="white")
-    table.add_column("Time", style="magenta")
-
-    for sub in subs[:20]:  # Show last 20
-        table.add_row(
-            sub.id,
-            sub.problem,
-            sub.compiler,
-            format_result_color(sub.result),
-            sub.time,
-        )
-
-    console.print(table)
-
-
-@cli.command()
-@click.argument("submission_id", type=str)
-def feedback(submission_id: str):
-    """Show detailed test results for a specific submission."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    console.print(f"[cyan]Fetching feedback for submission {submission_id}...[/cyan]")
-    tests = client.get_feedback(submission_id)
-
-    if tests:
-        console.print(f"\n[bold cyan]Test Results for Submission {submission_id}:[/bold cyan]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Test", style="cyan")
-        table.add_column("Result", style="white")
-        table.add_column("Time", style="yellow")
-        table.add_column("Memory", style="yellow")
-        table.add_column("Comment", style="white")
-
-        for test in tests:
-            table.add_row(
-                test.test_id,
-                format_result_color(test.result),
-                test.time,
-                test.memory,
-                test.comment,
-            )
-
-        console.print(table)
-    else:
-        console.print("[yellow]No test results found for this submission.[/yellow]")
-
-
-@cli.command(name="get-submit")
-def get_submit():
-    """Download source code of a previously submitted solution."""
-    client = TestSysClient()
-
-    if not client.auto_login():
-        console.print("[yellow]Not logged in. Please login first.[/yellow]")
-        if not client.login():
-            return
-
-    console.print("[cyan]Fetching submissions...[/cyan]")
-    subs = client.get_all_submissions()
-
-    if not subs:
-        console.print("[yellow]No submissions found.[/yellow]")
-        return
-
-    # Display submissions table
-    table = Table(title="Available Submissions", show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="cyan")
-    table.add_column("Problem", style="yellow")
-    table.add_column("Compiler", style="white")
-    table.add_column("Result", style="white")
-    table.add_column("Time", style="magenta")
-
-    for sub in subs[:20]:  # Show last 20
-        table.add_row(
-            sub.id,
-            sub.problem,
-            sub.compiler,
-            format_result_color(sub.result),
-            sub.time,
-        )
-
-    console.print(table)
-
-    # Ask user for submission ID
-    submission_id = console.input("\n[bold cyan]Enter submission ID to download:[/bold cyan] ").strip()
-
-    if not submission_id:
-        console.print("[yellow]No submission ID provided.[/yellow]")
-        return
+def get_local_config(obj: dict) -> Optional["LocalConfig"]:
+    """
+    Load the local config once per CLI invocation.
+    The result (including None) is memoized in the root context object.
+    """
+    if "local_config" not in obj:
+        from .config import LocalConfig
 
-    # Find submission by ID
-    submission = None
-    for sub in subs:
-        if sub.id == submission_id:
-            submission = sub
-            break
+        obj["local_config"] = LocalConfig.load()
+    return obj["local_config"]
 
-    if not submission:
-        console.print(f"[red]Submission with ID {submission_id} not found.[/red]")
-        return
 
-    if not submission.text_url:
-        console.print(f"[red]No text URL available for submission {submission_id}.[/red]")
-        return
+def get_client(obj: dict) -> "TestSysClient":
+    """
+    Create the TestSys client once per CLI invocation.
+    Everything a command does then shares one session and its connection pool.
+    """
+    if "client" not in obj:
+        from .client import TestSysClient
 
-    # Download submission text
-    console.print(f"[cyan]Downloading submission {submission_id}...[/cyan]")
-    try:
-        source_code = client.download_submission_text(submission.text_url)
-        
-        # Determine file extension based on problem ID
-        # Problem format is like "17A", "18B", etc.
-        problem_id = submission.problem
-        filename = f"{problem_id}.cpp"
-        
-        # Save to file
-        output_path = Path(filename)
-        output_path.write_text(source_code, encoding='utf-8')
-        
-        console.print(f"[green]Successfully saved to {filename}[/green]")
-        console.print(f"[dim]Problem: {submission.problem}[/dim]")
-        console.print(f"[dim]Result: {submission.result}[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error downloading submission: {e}[/red]")
+        obj["client"] = TestSysClient()
+    return obj["client"]
 
 
 @cli.command()
 def version():
     """Show version information."""
-    console.print("[bold cyan]tsweb_py[/bold cyan] version [green]1.0.0[/green]")
-    console.print("CLI client for TestSys online judge system")
+    click.echo("tsweb_py version 1.0.0")
+    click.echo("CLI client for TestSys online judge system")
 
 
 def main():
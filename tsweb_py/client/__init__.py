@@ -1,6 +1,28 @@
 """Client module for TestSys interaction."""
 
-from .client import TestSysClient
-from .models import Problem, Compiler, Contest, Submission, Test
+from typing import TYPE_CHECKING
 
-__all__ = ["TestSysClient", "Problem", "Compiler", "Contest", "Submission", "Test"]
+from .models import Problem, Compiler, Contest, ContestBundle, Submission, Test
+
+if TYPE_CHECKING:
+    from .client import TestSysClient
+
+__all__ = [
+    "TestSysClient",
+    "Problem",
+    "Compiler",
+    "Contest",
+    "ContestBundle",
+    "Submission",
+    "Test",
+]
+
+
+def __getattr__(name: str):
+    # Import the HTTP client (requests, lxml) only when it is first used,
+    # so importing the models stays cheap (PEP 562)
+    if name == "TestSysClient":
+        from .client import TestSysClient
+
+        return TestSysClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,118 @@
 """Main TestSys HTTP client with scraping capabilities."""
 
 import getpass
+import os
 import re
-from typing import List, Optional
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape as html_unescape
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
 
 import requests
-from bs4 import BeautifulSoup
-from rich.console import Console
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 
-from .models import Contest, Submission, Test, Problem, Compiler
+from .models import Contest, ContestBundle, Submission, Test, Problem, Compiler
 from ..config.global_config import GlobalConfig
-
-
-console = Console()
+from ..utils.terminal import get_console
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+# TestSys serves KOI8-R; lxml decodes raw bytes in C, so scrapers skip str decoding
+_HTML_PARSER = etree.HTMLParser(encoding="koi8-r")
+
+# XPath selectors for the fixed page layouts, compiled once
+_XP_BORDER_TABLE = etree.XPath('//table[@border="1"]')
+_XP_FIRST_TABLE = etree.XPath("(//table)[1]")
+_XP_PROB_OPTIONS = etree.XPath('(//select[@name="prob"])[1]//option[not(@disabled)]')
+_XP_LANG_OPTIONS = etree.XPath('(//select[@name="lang"])[1]//option[not(@disabled)]')
+
+# Comments, script/style blocks and tags; removing them leaves the page text
+_RE_MARKUP = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|<[^>]*>", re.S | re.I)
+# Lines of the main page (/t/) text, compiled once
+_RE_USER_LINE = re.compile(r"^\s*You are (?!currently)(.*?)\s*$", re.M)
+_RE_CONTEST_LINE = re.compile(r"^\s*Assigned contest: (.*?)\s*$", re.M)
+_RE_CONTEST_START = re.compile(
+    r"^\s*Contest starts at (\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}:\d{2}) and lasts (\d+) minutes",
+    re.M,
+)
+# Any mention of "error" in a submit response (this covers the <TITLE>Error</TITLE> page)
+_RE_SUBMIT_ERROR = re.compile(rb"error", re.I)
+# Submission ID in a redirect or result URL; only the pages keyed by a
+# submission ID count (feedback and source text), not any `id=` parameter
+_RE_SUBMISSION_ID = re.compile(r"/t/(?:feedback|text)\?(?:[^#]*&)?id=(\d+)")
+# Google Drive file IDs: /file/d/FILE_ID/... and ...?id=FILE_ID
+_RE_GDRIVE_FILE = re.compile(r"/file/d/([a-zA-Z0-9_-]+)")
+_RE_GDRIVE_ID = re.compile(r"[?&]id=([a-zA-Z0-9_-]+)")
+
+
+def _stripped_text(element) -> str:
+    """Element text like BeautifulSoup's get_text(strip=True): pieces stripped, then joined."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _parse_html(content: bytes):
+    """Parse a raw page into an lxml tree; returns None for an empty document."""
+    return etree.fromstring(content, _HTML_PARSER)
+
+
+def _table_cells(content: bytes, table_xpath: etree.XPath) -> Optional[List[List[str]]]:
+    """
+    Return the cell texts of each row (header included) of the first table
+    matched by `table_xpath`, or None if there is none.
+    """
+    root = _parse_html(content)
+    tables = table_xpath(root) if root is not None else None
+    if not tables:
+        return None
+    return [[_stripped_text(cell) for cell in row.iter("td")] for row in tables[0].iter("tr")]
+
+
+def _pull_events(parser, chunks: Iterable[bytes]) -> Iterator[tuple]:
+    """Feed byte chunks to an lxml pull parser, yielding its events as they fire."""
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+class _ProgressReader:
+    """Read-only file wrapper that advances a rich progress task by the bytes read."""
+
+    def __init__(self, raw, progress, task):
+        self._raw = raw
+        self._progress = progress
+        self._task = task
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._progress.update(self._task, advance=len(data))
+        return data
+
+
+def _select_options(root, options_xpath: etree.XPath) -> List[Tuple[str, str]]:
+    """
+    Return (value, text) of the non-empty options matched by
+    `options_xpath` in a parsed page (None for an empty page).
+    """
+    if root is None:
+        return []
+    return [
+        (option.get("value", ""), _stripped_text(option))
+        for option in options_xpath(root)
+        # Skip placeholder options; disabled ones are excluded by the XPath
+        if option.get("value")
+    ]
 
 
 class TestSysClient:
@@ -22,15 +120,58 @@ class TestSysClient:
 
     BASE_URL = "https://tsweb.ru"
     ENCODING = "koi8-r"
+    # Seconds to reuse pages that rarely change (contest list, submit form)
+    PAGE_CACHE_TTL = 60
+    _SUBMIT_PAGE_KEY = ("/t/submit", ())
+    # Seconds after the last confirmed use that saved cookies are trusted unchecked
+    SESSION_TRUST_SECONDS = 10 * 60
+    # Page markers, matched on the raw bytes (ASCII, so no KOI8-R decode needed)
+    NOT_LOGGED_IN = b"You are currently not logged in"
+    ERROR_PAGE = b"<HTML><HEAD><TITLE>Error</TITLE>"
+    # Bytes read per iteration when streaming downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    # Bytes fed to the parser per iteration when streaming a page
+    STREAM_CHUNK_SIZE = 64 * 1024
 
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize the client."""
         self.config_path = config_path or Path.home() / ".tsweb_py.global"
         self.cookies_path = Path.home() / ".tsweb_py.cookies"
         self.session = requests.Session()
+        # Keep a small pool of keep-alive connections to tsweb.ru for all requests.
+        # Failed connects and transient server errors are retried with backoff;
+        # urllib3 only retries idempotent methods by default, so a submit POST is
+        # never sent twice. Read timeouts are not retried, so a slow page fails
+        # after one timeout and reaches the Timeout handlers below
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=False,
+                status=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Connection": "keep-alive", "User-Agent": "tsweb_py/1.0.0"}
+        )
         self.config = GlobalConfig.load(self.config_path)
+        # (path, params) -> (fetched_at, raw page); see _get_cached
+        self._page_cache: Dict[tuple, Tuple[float, bytes]] = {}
+
+        # Set when auto_login trusted saved cookies without asking the server;
+        # the lock lets exactly one request perform the check (see _get_bytes)
+        self._session_unverified = False
+        self._session_lock = threading.Lock()
+        # ID of the last successful submit, if the server revealed it
+        self.last_submission_id: Optional[str] = None
 
-        # Restore cookies from pickle file
+        # Restore cookies saved by a previous run
         saved_cookies = GlobalConfig.load_cookies(self.cookies_path)
         if saved_cookies:
             self.session.cookies = saved_cookies
@@ -39,37 +180,64 @@ class TestSysClient:
         """Save current config and cookies to disk."""
         # Save credentials
         self.config.save(self.config_path)
-        # Save cookies separately using pickle
+        # Save cookies separately as JSON
         GlobalConfig.save_cookies(self.session.cookies, self.cookies_path)
 
     def _get(self, path: str, **kwargs) -> str:
         """Make GET request and decode with KOI8-R."""
+        return self._get_bytes(path, **kwargs).decode(self.ENCODING, errors="ignore")
+
+    def _get_bytes(self, path: str, **kwargs) -> bytes:
+        """Make GET request and return the raw, undecoded body."""
+        if self._session_unverified:
+            # The first request on a trusted session doubles as its login check;
+            # concurrent requests wait here until that check has finished
+            with self._session_lock:
+                if self._session_unverified:
+                    return self._verify_session(path, **kwargs)
+        return self._fetch_bytes(path, **kwargs)
+
+    def _fetch_bytes(self, path: str, **kwargs) -> bytes:
+        """Send a GET request and return the raw body, without any session check."""
         url = f"{self.BASE_URL}{path}"
         # Add default timeout if not specified
         # Use tuple (connect_timeout, read_timeout) for better control
         if 'timeout' not in kwargs:
             kwargs['timeout'] = (10, 30)  # 10s to connect, 30s to read
-        
-        # Close existing connections to avoid keep-alive issues
-        # This helps prevent hanging on repeated requests
-        if hasattr(self.session, 'close') and path == "/t/allsubmits":
-            # Only for allsubmits to avoid breaking other requests
-            for adapter in self.session.adapters.values():
-                adapter.close()
-        
+
         response = self.session.get(url, **kwargs)
         response.raise_for_status()
-        return response.content.decode(self.ENCODING, errors="ignore")
+        return response.content
+
+    def _verify_session(self, path: str, **kwargs) -> bytes:
+        """
+        Fetch `path` on a session trusted by auto_login and confirm it is still
+        logged in; if it has expired, log in again and fetch once more.
+        When the saved credentials are rejected, the user is prompted as the
+        commands do after a failed auto_login; if that fails too, RuntimeError
+        is raised rather than returning the "not logged in" page.
+        Called with _session_lock held.
+        """
+        content = self._fetch_bytes(path, **kwargs)
+        self._session_unverified = False
+        if self.NOT_LOGGED_IN not in content:
+            self._touch_cookies()
+            get_console().print(f"[green]Using saved session for {self.config.user}[/green]")
+            return content
+        if not self.login(self.config.user, self.config.password):
+            get_console().print("[yellow]Not logged in. Please login first.[/yellow]")
+            if not self.login():
+                raise RuntimeError("Not logged in to TestSys")
+        return self._fetch_bytes(path, **kwargs)
 
     def _post(self, path: str, data: dict = None, **kwargs) -> str:
         """Make POST request and decode with KOI8-R."""
         url = f"{self.BASE_URL}{path}"
-        # Encode form data to KOI8-R if provided
+        # Encode form data to KOI8-R once as a ready urlencoded body
         if data:
-            encoded_data = {
-                k: v.encode(self.ENCODING) if isinstance(v, str) else v
-                for k, v in data.items()
-            }
+            encoded_data = urlencode(data, encoding=self.ENCODING)
+            headers = kwargs.setdefault("headers", {})
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
         else:
             encoded_data = None
         # Add default timeout if not specified
@@ -80,6 +248,54 @@ class TestSysClient:
         response.raise_for_status()
         return response.content.decode(self.ENCODING, errors="ignore")
 
+    def _get_stream(self, path: str, **kwargs) -> Iterator[bytes]:
+        """
+        Make a streamed GET request and yield the raw body in chunks as they arrive.
+        If the consumer stops early, the rest is read (not parsed) so the
+        connection goes back to the pool.
+        """
+        url = f"{self.BASE_URL}{path}"
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = (10, 30)  # 10s to connect, 30s to read
+
+        with self.session.get(url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+            try:
+                yield from chunks
+            finally:
+                for _ in chunks:
+                    pass
+
+    def _soup(self, content: bytes, only: Optional[str] = None) -> "BeautifulSoup":
+        """
+        Parse a raw KOI8-R page with BeautifulSoup on top of lxml's C parser,
+        which decodes the bytes itself (every byte is valid KOI8-R).
+        If `only` names a tag, just those elements are built (SoupStrainer).
+        bs4 is imported here, as only a few rarely used pages still need it.
+        """
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        parse_only = SoupStrainer(only) if only else None
+        return BeautifulSoup(
+            content, "lxml", from_encoding=self.ENCODING, parse_only=parse_only
+        )
+
+    def _get_cached(self, path: str, params: Optional[dict] = None) -> bytes:
+        """
+        GET a rarely changing page, reusing the raw body for PAGE_CACHE_TTL seconds.
+        The cache lives for one client and is dropped on login or contest change.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        cached = self._page_cache.get(key)
+        if cached and now - cached[0] < self.PAGE_CACHE_TTL:
+            return cached[1]
+
+        content = self._get_bytes(path, params=params) if params else self._get_bytes(path)
+        self._page_cache[key] = (now, content)
+        return content
+
     def login(
         self, username: Optional[str] = None, password: Optional[str] = None
     ) -> bool:
@@ -94,6 +310,7 @@ class TestSysClient:
 
         # Clear existing cookies to avoid conflicts
         self.session.cookies.clear()
+        self._page_cache.clear()
 
         # GET login with params
         try:
@@ -108,22 +325,21 @@ class TestSysClient:
             )
 
             if login_response.status_code != 200:
-                console.print("[red]Login failed: Server error[/red]")
+                get_console().print("[red]Login failed: Server error[/red]")
                 return False
 
             # Check if we're actually logged in by checking main page
             main_response = self.session.get(f"{self.BASE_URL}/t/")
-            main_response.encoding = self.ENCODING
-            main_html = main_response.text
+            main_page = main_response.content
 
             # Check for error page
-            if "<HTML><HEAD><TITLE>Error</TITLE>" in main_html:
-                console.print("[red]Login failed: Invalid credentials[/red]")
+            if self.ERROR_PAGE in main_page:
+                get_console().print("[red]Login failed: Invalid credentials[/red]")
                 return False
 
             # Check if not logged in
-            if "You are currently not logged in" in main_html:
-                console.print("[red]Login failed: Invalid credentials[/red]")
+            if self.NOT_LOGGED_IN in main_page:
+                get_console().print("[red]Login failed: Invalid credentials[/red]")
                 return False
 
             # Save credentials and cookies
@@ -131,10 +347,10 @@ class TestSysClient:
             self.config.password = password
             self._save_config()
 
-            console.print(f"[green]Successfully logged in as {username}[/green]")
+            get_console().print(f"[green]Successfully logged in as {username}[/green]")
             return True
         except Exception as e:
-            console.print(f"[red]Login error: {e}[/red]")
+            get_console().print(f"[red]Login error: {e}[/red]")
             return False
 
     def auto_login(self) -> bool:
@@ -142,326 +358,429 @@ class TestSysClient:
         if not self.config.has_credentials():
             return False
 
-        # First check if current session is still valid
-        try:
-            html = self._get("/t/")
-            if "You are currently not logged in" not in html:
-                console.print(
-                    f"[green]Using saved session for {self.config.user}[/green]"
-                )
-                return True
-        except:
-            pass
+        # Recently used cookies skip the /t/ probe; the first real request
+        # confirms them and logs in again if they have expired (see _get_bytes)
+        if self._cookies_recent():
+            self._session_unverified = True
+            return True
+
+        # First check if current session is still valid; without an unexpired
+        # cookie the server can only answer "not logged in", so skip the probe
+        if self._cookies_alive():
+            try:
+                content = self._get_bytes("/t/")
+                if self.NOT_LOGGED_IN not in content:
+                    self._touch_cookies()
+                    get_console().print(
+                        f"[green]Using saved session for {self.config.user}[/green]"
+                    )
+                    return True
+            except:
+                pass
 
         # Session expired, re-login
         return self.login(self.config.user, self.config.password)
 
+    def _cookies_alive(self) -> bool:
+        """Check whether the session holds any cookie that has not expired locally."""
+        now = time.time()
+        return any(not cookie.is_expired(now) for cookie in self.session.cookies)
+
+    def _cookies_recent(self) -> bool:
+        """Check whether saved cookies were confirmed valid within SESSION_TRUST_SECONDS."""
+        if not self._cookies_alive():
+            return False
+        try:
+            age = time.time() - os.stat(self.cookies_path).st_mtime
+        except OSError:
+            return False
+        return 0 <= age < self.SESSION_TRUST_SECONDS
+
+    def _touch_cookies(self) -> None:
+        """Mark the saved cookies as just confirmed valid."""
+        try:
+            os.utime(self.cookies_path)
+        except OSError:
+            pass
+
     def get_available_contests(self) -> List[Contest]:
         """Scrape list of available contests."""
-        html = self._get("/t/contests", params={"mask": "1"})
-        soup = BeautifulSoup(html, "html.parser")
-        contests = []
+        content = self._get_cached("/t/contests", params={"mask": "1"})
 
         # Find contest table
-        table = soup.find("table", {"border": "1"})
-        if not table:
-            return contests
-
-        rows = table.find_all("tr")[1:]  # Skip header
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) < 3:
-                continue
-
-            # Extract contest info
-            contest_id = cols[0].get_text(strip=True)
-            name = cols[1].get_text(strip=True)
-            status = cols[2].get_text(strip=True)
-
-            contest = Contest(id=contest_id, name=name, status=status)
-            contests.append(contest)
+        rows = _table_cells(content, _XP_BORDER_TABLE)
+        if rows is None:
+            return []
 
-        return contests
+        return [
+            Contest(id=cols[0], name=cols[1], status=cols[2])
+            for cols in rows[1:]  # Skip header
+            if len(cols) >= 3
+        ]
 
     def change_contest(self, contest_id: str) -> bool:
         """Switch to a different contest."""
         try:
-            # Use session directly to avoid cookie issues
-            response = self.session.get(
-                f"{self.BASE_URL}/t/index",
+            # Goes through _get_bytes so a trusted but expired session logs in
+            # first; a non-200 answer raises and is reported below
+            self._get_bytes(
+                "/t/index",
                 params={"op": "changecontest", "newcontestid": contest_id},
             )
-            response.encoding = self.ENCODING
-            html = response.text
 
-            # Check for success - the page should redirect or show success
             # Usually after changing contest, we get redirected to main page
-            if response.status_code == 200:
-                self._save_config()
-                return True
-            return False
+            # Problems and compilers differ per contest
+            self._page_cache.clear()
+            self._save_config()
+            return True
         except Exception as e:
-            console.print(f"[red]Failed to change contest: {e}[/red]")
+            get_console().print(f"[red]Failed to change contest: {e}[/red]")
             return False
 
+    def get_contest_bundle(self) -> ContestBundle:
+        """
+        Fetch user info, problems and compilers for the current contest.
+        TestSys has no batch endpoint, so the submit page (problems and compilers)
+        is fetched on a worker thread while this thread loads the user info page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            submit_page = executor.submit(self.get_problems_and_compilers)
+            user_info = self.get_user_info()
+            problems, compilers = submit_page.result()
+        return ContestBundle(user_info=user_info, problems=problems, compilers=compilers)
+
     def get_user_info(self) -> dict:
         """Get current user information."""
         html = self._get("/t/")
-        soup = BeautifulSoup(html, "html.parser")
-        page_text = soup.get_text()
-        lines = page_text.split("\n")
+        # The lines we need are plain text, so strip the markup instead of parsing
+        page_text = html_unescape(_RE_MARKUP.sub("", html))
 
         user_info = {}
-        for line in lines:
-            line = line.strip()
-            if line.startswith("You are") and not line.startswith("You are currently"):
-                user_info["name"] = line.replace("You are ", "")
-            if line.startswith("Assigned contest:"):
-                user_info["contest"] = line.replace("Assigned contest: ", "")
-            
-            # Parse contest deadline
-            # Format: "Contest starts at 16.02.2026 00:00:00 and lasts 7199 minutes"
-            if line.startswith("Contest starts at") and "lasts" in line:
-                try:
-                    # Extract start time and duration
-                    match = re.search(
-                        r"Contest starts at (\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}:\d{2}) and lasts (\d+) minutes",
-                        line
-                    )
-                    if match:
-                        start_str = match.group(1)
-                        duration_minutes = int(match.group(2))
-                        
-                        # Parse start time: "16.02.2026 00:00:00"
-                        start_time = datetime.strptime(start_str, "%d.%m.%Y %H:%M:%S")
-                        
-                        # Calculate deadline
-                        deadline = start_time + timedelta(minutes=duration_minutes)
-                        
-                        # Store both formatted string and datetime object
-                        user_info["deadline"] = deadline.strftime("%d.%m.%Y %H:%M:%S")
-                        user_info["deadline_obj"] = deadline
-                except (ValueError, AttributeError) as e:
-                    # If parsing fails, just skip
-                    pass
+        # A later line wins, as with the old line-by-line scan
+        names = _RE_USER_LINE.findall(page_text)
+        if names:
+            user_info["name"] = names[-1]
+        contests = _RE_CONTEST_LINE.findall(page_text)
+        if contests:
+            user_info["contest"] = contests[-1]
+
+        # Parse contest deadline
+        # Format: "Contest starts at 16.02.2026 00:00:00 and lasts 7199 minutes"
+        for match in _RE_CONTEST_START.finditer(page_text):
+            try:
+                start_str = match.group(1)
+                duration_minutes = int(match.group(2))
+
+                # Parse start time: "16.02.2026 00:00:00"
+                start_time = datetime.strptime(start_str, "%d.%m.%Y %H:%M:%S")
+
+                # Calculate deadline
+                deadline = start_time + timedelta(minutes=duration_minutes)
+
+                # Store both formatted string and datetime object
+                user_info["deadline"] = deadline.strftime("%d.%m.%Y %H:%M:%S")
+                user_info["deadline_obj"] = deadline
+            except ValueError:
+                # If parsing fails, just skip
+                pass
 
         return user_info
 
+    def _submit_page(self) -> bytes:
+        """
+        Raw /t/submit page, the source of both problems and compilers.
+        Served from the page cache; submit() drops it (_SUBMIT_PAGE_KEY).
+        """
+        return self._get_cached("/t/submit")
+
     def get_problems(self) -> List[Problem]:
         """Scrape available problems from submit page."""
-        html = self._get("/t/submit")
-        soup = BeautifulSoup(html, "html.parser")
-        problems = []
-
-        # Find problem select dropdown
-        select = soup.find("select", {"name": "prob"})
-        if not select:
-            return problems
-
-        for option in select.find_all("option"):
-            problem_id = option.get("value", "")
-            problem_name = option.get_text(strip=True)
-
-            # Skip disabled/placeholder options
-            if problem_id and not option.get("disabled"):
-                problems.append(
-                    Problem(problem_id=problem_id, problem_name=problem_name)
-                )
-
-        return problems
+        return self._problems_from(_parse_html(self._submit_page()))
 
     def get_compilers(self) -> List[Compiler]:
         """Scrape available compilers from submit page."""
-        html = self._get("/t/submit")
-        soup = BeautifulSoup(html, "html.parser")
+        return self._compilers_from(_parse_html(self._submit_page()))
+
+    def get_problems_and_compilers(self) -> Tuple[List[Problem], List[Compiler]]:
+        """Scrape problems and compilers from a single parse of the submit page."""
+        root = _parse_html(self._submit_page())
+        return self._problems_from(root), self._compilers_from(root)
+
+    @staticmethod
+    def _problems_from(root) -> List[Problem]:
+        """Build problems from the prob select of a parsed submit page."""
+        return [
+            Problem(problem_id=problem_id, problem_name=problem_name)
+            for problem_id, problem_name in _select_options(root, _XP_PROB_OPTIONS)
+        ]
+
+    @staticmethod
+    def _compilers_from(root) -> List[Compiler]:
+        """Build compilers from the lang select of a parsed submit page."""
         compilers = []
 
-        # Find compiler select dropdown
-        select = soup.find("select", {"name": "lang"})
-        if not select:
-            return compilers
-
-        for option in select.find_all("option"):
-            compiler_id = option.get("value", "")
-            full_name = option.get_text(strip=True)
-
-            # Skip disabled/placeholder options
-            if compiler_id and not option.get("disabled"):
-                # Extract language prefix (e.g., "cpp:", "py:")
-                lang = "Unknown"
-                if ":" in full_name:
-                    lang_prefix = full_name.split(":")[0].strip()
-                    lang = lang_prefix
-
-                compilers.append(
-                    Compiler(
-                        compiler_id=compiler_id,
-                        compiler_name=full_name,
-                        compiler_lang=lang,
-                    )
+        for compiler_id, full_name in _select_options(root, _XP_LANG_OPTIONS):
+            # Extract language prefix (e.g., "cpp:", "py:")
+            lang = "Unknown"
+            if ":" in full_name:
+                lang = full_name.split(":")[0].strip()
+
+            compilers.append(
+                Compiler(
+                    compiler_id=compiler_id,
+                    compiler_name=full_name,
+                    compiler_lang=lang,
                 )
+            )
 
         return compilers
 
-    def submit(self, problem_id: str, compiler_id: str, solution_path: Path) -> bool:
-        """Submit a solution."""
+    def submit(self, problem_id: str, compiler_id: str, solution_path: Union[str, Path]) -> bool:
+        """
+        Submit a solution.
+        On success, last_submission_id holds the new submission's ID when the
+        response (redirect or final URL) carries one, otherwise None.
+        """
+        filename = os.path.basename(solution_path)
+        self.last_submission_id = None
         try:
+            if self._session_unverified:
+                # A POST cannot be retried after a re-login, so confirm the session first
+                self._get_bytes("/t/")
+
             with open(solution_path, "rb") as f:
-                files = {"file": (solution_path.name, f, "application/octet-stream")}
+                files = {"file": (filename, f, "application/octet-stream")}
                 data = {"prob": problem_id, "lang": compiler_id}
 
                 url = f"{self.BASE_URL}/t/submit"
                 response = self.session.post(url, data=data, files=files)
                 response.raise_for_status()
 
-                html = response.content.decode(self.ENCODING, errors="ignore")
-
-                # Check for errors
-                soup = BeautifulSoup(html, "html.parser")
-                if "<TITLE>Error</TITLE>" in html or "error" in html.lower():
-                    console.print(f"[red]Submission may have failed[/red]")
+                # Check for errors on the raw body; one case-insensitive C scan
+                if _RE_SUBMIT_ERROR.search(response.content):
+                    get_console().print(f"[red]Submission may have failed[/red]")
                     return False
 
-                console.print(f"[cyan]Submitted {solution_path.name}[/cyan]")
-                console.print(
+                self.last_submission_id = self._submission_id_from(response)
+                # The submit form may change after a submission; refetch next time
+                self._page_cache.pop(self._SUBMIT_PAGE_KEY, None)
+
+                get_console().print(f"[cyan]Submitted {filename}[/cyan]")
+                get_console().print(
                     f"[yellow]Problem: {problem_id}  [magenta]Compiler: {compiler_id}[/magenta][/yellow]"
                 )
                 return True
         except Exception as e:
-            console.print(f"[red]Failed to submit: {e}[/red]")
+            get_console().print(f"[red]Failed to submit: {e}[/red]")
             return False
 
-    def get_all_submissions(self, debug: bool = False) -> List[Submission]:
-        """Scrape all submissions from the submissions page."""
-        import time
+    @staticmethod
+    def _submission_id_from(response) -> Optional[str]:
+        """Find a submission ID in a feedback/text URL of the redirect chain or final URL."""
+        locations = [r.headers.get("Location", "") for r in response.history]
+        locations.append(response.url)
+        for location in locations:
+            match = _RE_SUBMISSION_ID.search(location or "")
+            if match:
+                return match.group(1)
+        return None
+
+    def iter_submissions(
+        self, limit: Optional[int] = None, debug: bool = False
+    ) -> Iterator[Submission]:
+        """
+        Yield submissions from the submissions page, newest first.
+        The page is requested on first iteration and parsed while it downloads;
+        rows are parsed only as they are consumed, and at most `limit` of them
+        if given. Request errors propagate.
+        """
         start_time = time.time()
+        if debug:
+            get_console().print(f"[cyan]DEBUG: [{time.strftime('%H:%M:%S')}] Starting HTTP GET request to /t/allsubmits...[/cyan]")
+
+        if self._session_unverified:
+            # The login check of a trusted session needs the whole page first
+            chunks = (self._get_bytes("/t/allsubmits"),)
+        else:
+            chunks = self._get_stream("/t/allsubmits")
+
         try:
-            if debug:
-                console.print(f"[cyan]DEBUG: [{time.strftime('%H:%M:%S')}] Starting HTTP GET request to /t/allsubmits...[/cyan]")
-            
-            html = self._get("/t/allsubmits")
-            
+            yield from islice(self._parse_submissions(chunks, debug=debug), limit)
+        finally:
             if debug:
                 elapsed = time.time() - start_time
-                console.print(f"[cyan]DEBUG: [{time.strftime('%H:%M:%S')}] HTTP request completed in {elapsed:.2f}s, received {len(html)} bytes[/cyan]")
-                console.print(f"[cyan]DEBUG: Starting BeautifulSoup parsing...[/cyan]")
-            
-            soup = BeautifulSoup(html, "html.parser")
-            
-            if debug:
-                console.print(f"[cyan]DEBUG: BeautifulSoup parsing completed[/cyan]")
-            submissions = []
+                get_console().print(f"[cyan]DEBUG: [{time.strftime('%H:%M:%S')}] Submissions page read in {elapsed:.2f}s[/cyan]")
 
-            # Find submissions table
-            table = soup.find("table", {"border": "1"})
-            if not table:
-                if debug:
-                    console.print("[yellow]DEBUG: No submissions table found[/yellow]")
-                return submissions
-
-            rows = table.find_all("tr")
-            if debug:
-                console.print(f"[dim]DEBUG: Found {len(rows)} rows in submissions table[/dim]")
-            
-            # Find header row to determine column positions
-            header_found = False
-            for idx, row in enumerate(rows):
-                if not header_found:
-                    # Skip until we find the header row
-                    cells = row.find_all("td")
-                    if cells and cells[0].get_text(strip=True) == "ID":
-                        header_found = True
-                        if debug:
-                            console.print(f"[dim]DEBUG: Header row found at index {idx}[/dim]")
-                    continue
-
-                cols = row.find_all("td")
-                if len(cols) < 6:
-                    if debug:
-                        console.print(f"[dim]DEBUG: Skipping row with {len(cols)} columns (need 6+)[/dim]")
-                    continue
-
-                # Parse text URL from "Text" column (column 7)
-                # Table structure: ID, Problem, Attempt, Time, Compiler, Result, TestN, Text, CE cause, Feedback, Diff
-                text_url = None
-                if len(cols) > 7:
-                    text_link = cols[7].find('a')
-                    if text_link and text_link.get('href'):
-                        text_url = text_link.get('href')
-
-                submission = Submission(
-                    id=cols[0].get_text(strip=True),
-                    problem=cols[1].get_text(strip=True),
-                    compiler=cols[4].get_text(strip=True),
-                    result=cols[5].get_text(strip=True),
-                    time=cols[3].get_text(strip=True),
-                    text_url=text_url,
-                )
-                submissions.append(submission)
+    def get_all_submissions(
+        self, debug: bool = False, limit: Optional[int] = None
+    ) -> List[Submission]:
+        """
+        Scrape submissions from the submissions page, newest first.
+        If limit is given, parsing stops after that many rows.
+        """
+        try:
+            submissions = list(self.iter_submissions(limit=limit, debug=debug))
 
             if debug:
-                console.print(f"[dim]DEBUG: Parsed {len(submissions)} submissions[/dim]")
+                get_console().print(f"[dim]DEBUG: Parsed {len(submissions)} submissions[/dim]")
             return submissions
         except requests.exceptions.Timeout:
-            console.print(f"[red]ERROR: Request to /t/allsubmits timed out after 30 seconds[/red]")
-            console.print(f"[yellow]This may indicate a slow network or server issue.[/yellow]")
+            get_console().print(f"[red]ERROR: Request to /t/allsubmits timed out after 30 seconds[/red]")
+            get_console().print(f"[yellow]This may indicate a slow network or server issue.[/yellow]")
             return []
         except requests.exceptions.RequestException as e:
-            console.print(f"[red]ERROR: Network error in get_all_submissions: {e}[/red]")
+            get_console().print(f"[red]ERROR: Network error in get_all_submissions: {e}[/red]")
             return []
         except Exception as e:
-            console.print(f"[red]ERROR in get_all_submissions: {e}[/red]")
+            get_console().print(f"[red]ERROR in get_all_submissions: {e}[/red]")
             if debug:
                 import traceback
-                console.print(f"[red]{traceback.format_exc()}[/red]")
+                get_console().print(f"[red]{traceback.format_exc()}[/red]")
             return []
 
+    def get_submission(self, submission_id: str, debug: bool = False) -> Optional[Submission]:
+        """
+        Get a single submission by ID.
+        TestSys has no per-submission page, so this scans the submissions page
+        and stops at the matching row (usually the first one).
+        Returns None if the submission is not listed or the request fails.
+        """
+        try:
+            for submission in self.iter_submissions(debug=debug):
+                if submission.id == submission_id:
+                    return submission
+            return None
+        except requests.exceptions.Timeout:
+            get_console().print(f"[red]ERROR: Request to /t/allsubmits timed out after 30 seconds[/red]")
+            return None
+        except requests.exceptions.RequestException as e:
+            get_console().print(f"[red]ERROR: Network error in get_submission: {e}[/red]")
+            return None
+        except Exception as e:
+            get_console().print(f"[red]ERROR in get_submission: {e}[/red]")
+            if debug:
+                import traceback
+                get_console().print(f"[red]{traceback.format_exc()}[/red]")
+            return None
+
+    def _parse_submissions(
+        self, chunks: Iterable[bytes], debug: bool = False
+    ) -> Iterator[Submission]:
+        """
+        Yield submissions from the raw submissions page, given as byte chunks,
+        newest first. Rows are streamed through lxml's HTMLPullParser and freed
+        once parsed, so a caller that stops early never parses the rest of the page.
+        """
+        if debug:
+            get_console().print(f"[cyan]DEBUG: Streaming submissions table rows...[/cyan]")
+
+        parser = etree.HTMLPullParser(
+            events=("start", "end"), tag=("table", "tr"), encoding=self.ENCODING
+        )
+
+        # Only rows of the first <table border="1"> (nested rows included) are
+        # read; parsing stops once that table is closed
+        table = None
+        # Find header row to determine column positions
+        header_found = False
+        idx = -1
+        for event, element in _pull_events(parser, chunks):
+            if element.tag == "table":
+                if event == "start" and table is None and element.get("border") == "1":
+                    table = element
+                elif event == "end" and element is table:
+                    break
+                continue
+            if event != "end" or table is None:
+                continue
+            row = element
+            if not any(ancestor is table for ancestor in row.iterancestors("table")):
+                continue
+            idx += 1
+
+            cols = list(row.iter("td"))
+            if not header_found:
+                # Skip until we find the header row
+                if cols and _stripped_text(cols[0]) == "ID":
+                    header_found = True
+                    if debug:
+                        get_console().print(f"[dim]DEBUG: Header row found at index {idx}[/dim]")
+                continue
+
+            if len(cols) < 6:
+                if debug:
+                    get_console().print(f"[dim]DEBUG: Skipping row with {len(cols)} columns (need 6+)[/dim]")
+                continue
+
+            # Parse text URL from "Text" column (column 7)
+            # Table structure: ID, Problem, Attempt, Time, Compiler, Result, TestN, Text, CE cause, Feedback, Diff
+            text_url = None
+            if len(cols) > 7:
+                text_link = cols[7].find(".//a")
+                if text_link is not None and text_link.get('href'):
+                    text_url = text_link.get('href')
+
+            submission = Submission(
+                id=_stripped_text(cols[0]),
+                problem=_stripped_text(cols[1]),
+                compiler=_stripped_text(cols[4]),
+                result=_stripped_text(cols[5]),
+                time=_stripped_text(cols[3]),
+                text_url=text_url,
+            )
+
+            # Drop already parsed rows to keep memory bounded
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+            yield submission
+
+        if debug and not header_found:
+            get_console().print("[yellow]DEBUG: No submissions table found[/yellow]")
+
     def get_feedback(self, submission_id: str) -> List[Test]:
         """Get detailed test feedback for a submission."""
         try:
-            html = self._get("/t/feedback", params={"id": submission_id})
-            soup = BeautifulSoup(html, "html.parser")
-            tests = []
+            content = self._get_bytes("/t/feedback", params={"id": submission_id})
 
             # Find test results table
-            table = soup.find("table")
-            if not table:
-                console.print("[yellow]Warning: No test results table found[/yellow]")
-                return tests
+            rows = _table_cells(content, _XP_FIRST_TABLE)
+            if rows is None:
+                get_console().print("[yellow]Warning: No test results table found[/yellow]")
+                return []
 
-            rows = table.find_all("tr")
             if len(rows) <= 1:
-                console.print("[yellow]Warning: Empty test results table[/yellow]")
-                return tests
+                get_console().print("[yellow]Warning: Empty test results table[/yellow]")
+                return []
 
             # Skip header row
-            data_rows = rows[1:]
-
-            for row in data_rows:
-                cols = row.find_all("td")
-                if len(cols) < 2:
-                    continue
-
-                # Handle different table formats
-                test = Test(
-                    test_id=cols[0].get_text(strip=True) if len(cols) > 0 else "",
-                    result=cols[1].get_text(strip=True) if len(cols) > 1 else "",
-                    time=cols[2].get_text(strip=True) if len(cols) > 2 else "",
-                    memory=cols[3].get_text(strip=True) if len(cols) > 3 else "",
-                    comment=cols[4].get_text(strip=True) if len(cols) > 4 else "",
-                )
-                tests.append(test)
-
-            return tests
+            return [self._test_from(cols) for cols in rows[1:] if len(cols) >= 2]
         except Exception as e:
-            console.print(f"[yellow]Warning: Failed to fetch test results: {e}[/yellow]")
+            get_console().print(f"[yellow]Warning: Failed to fetch test results: {e}[/yellow]")
             return []
 
+    @staticmethod
+    def _test_from(cols: List[str]) -> Test:
+        """
+        Build a Test from the cell texts of a feedback row.
+        Handles different table formats: missing trailing columns
+        (time, memory, comment) become empty strings.
+        """
+        cols = cols + [""] * max(0, 5 - len(cols))
+        return Test(
+            test_id=cols[0],
+            result=cols[1],
+            time=cols[2],
+            memory=cols[3],
+            comment=cols[4],
+        )
+
     def get_statements_url(self) -> Optional[str]:
         """Get statements PDF URL from contest page."""
         try:
-            html = self._get("/t/index.html")
-            soup = BeautifulSoup(html, "html.parser")
+            content = self._get_bytes("/t/index.html")
+            soup = self._soup(content, only="a")
             
             # Find link with text "Statements" or similar
             for link in soup.find_all("a"):
@@ -471,10 +790,10 @@ class TestSysClient:
                     if url:
                         return url
             
-            console.print("[yellow]No statements link found on contest page[/yellow]")
+            get_console().print("[yellow]No statements link found on contest page[/yellow]")
             return None
         except Exception as e:
-            console.print(f"[red]Failed to fetch statements URL: {e}[/red]")
+            get_console().print(f"[red]Failed to fetch statements URL: {e}[/red]")
             return None
 
     def download_statements(self, output_path: Optional[Path] = None) -> bool:
@@ -500,37 +819,40 @@ class TestSysClient:
             output_path = Path.cwd() / filename
         
         try:
-            console.print(f"[cyan]Downloading from: {url}[/cyan]")
-            
-            # Stream download with progress bar
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get("content-length", 0))
+            get_console().print(f"[cyan]Downloading from: {url}[/cyan]")
             
-            with Progress(
-                *Progress.get_default_columns(),
-                DownloadColumn(),
-                TransferSpeedColumn(),
-                TimeRemainingColumn(),
-                console=console,
-            ) as progress:
-                task = progress.add_task(
-                    f"[cyan]Downloading {output_path.name}",
-                    total=total_size
-                )
-                
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            progress.update(task, advance=len(chunk))
-            
-            console.print(f"[green]Successfully downloaded to: {output_path}[/green]")
+            # Stream download with progress bar; memory stays at one chunk
+            with requests.get(url, stream=True, timeout=(10, 30)) as response:
+                response.raise_for_status()
+
+                total_size = int(response.headers.get("content-length", 0))
+
+                with Progress(
+                    *Progress.get_default_columns(),
+                    DownloadColumn(),
+                    TransferSpeedColumn(),
+                    TimeRemainingColumn(),
+                    console=get_console(),
+                ) as progress:
+                    task = progress.add_task(
+                        f"[cyan]Downloading {output_path.name}",
+                        total=total_size
+                    )
+
+                    # copyfileobj drives the read/write loop; the wrapper only reports progress
+                    response.raw.decode_content = True
+                    with open(output_path, "wb") as f:
+                        shutil.copyfileobj(
+                            _ProgressReader(response.raw, progress, task),
+                            f,
+                            length=self.DOWNLOAD_CHUNK_SIZE,
+                        )
+
+            get_console().print(f"[green]Successfully downloaded to: {output_path}[/green]")
             return True
             
         except Exception as e:
-            console.print(f"[red]Failed to download statements: {e}[/red]")
+            get_console().print(f"[red]Failed to download statements: {e}[/red]")
             return False
 
     def _convert_gdrive_url(self, url: str) -> str:
@@ -542,18 +864,18 @@ class TestSysClient:
         file_id = None
         
         # Pattern 1: /file/d/FILE_ID/
-        match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', url)
+        match = _RE_GDRIVE_FILE.search(url)
         if match:
             file_id = match.group(1)
         
         # Pattern 2: ?id=FILE_ID
         if not file_id:
-            match = re.search(r'[?&]id=([a-zA-Z0-9_-]+)', url)
+            match = _RE_GDRIVE_ID.search(url)
             if match:
                 file_id = match.group(1)
         
         if file_id:
-            console.print(f"[cyan]Detected Google Drive file ID: {file_id}[/cyan]")
+            get_console().print(f"[cyan]Detected Google Drive file ID: {file_id}[/cyan]")
             return f"https://drive.google.com/uc?export=download&id={file_id}"
         
         # If can't extract ID, return original URL
@@ -564,11 +886,10 @@ class TestSysClient:
         Fetch the monitor (leaderboard) page HTML.
         Monitor page uses windows-1251 encoding instead of KOI8-R.
         """
-        url = f"{self.BASE_URL}/t/monitor"
-        response = self.session.get(url, timeout=(10, 30))
-        response.raise_for_status()
-        # Monitor page uses windows-1251 encoding
-        return response.content.decode('windows-1251', errors="ignore")
+        content = self._get_bytes("/t/monitor")
+        # Monitor page uses windows-1251 encoding. Unlike KOI8-R it has unmapped
+        # bytes (0x98), on which parsing raw bytes would fail, so decode leniently here
+        return content.decode('windows-1251', errors="ignore")
 
     def download_submission_text(self, text_url: str) -> str:
         """
@@ -580,9 +901,9 @@ class TestSysClient:
         Returns:
             Source code as string
         """
-        html = self._get(text_url)
+        content = self._get_bytes(text_url)
         # The text page contains the source code in a <PRE> tag
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._soup(content)
         pre_tag = soup.find("pre")
         
         if pre_tag:
@@ -1,10 +1,12 @@
 """Data models for TestSys entities."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Problem:
     """Represents a problem in a contest."""
 
@@ -12,7 +14,7 @@ class Problem:
     problem_name: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Compiler:
     """Represents a compiler/language option."""
 
@@ -21,7 +23,7 @@ class Compiler:
     compiler_lang: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Test:
     """Represents a test case result."""
 
@@ -32,7 +34,7 @@ class Test:
     comment: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Submission:
     """Represents a solution submission."""
 
@@ -44,7 +46,7 @@ class Submission:
     text_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Contest:
     """Represents a contest."""
 
@@ -52,3 +54,12 @@ class Contest:
     name: str
     status: str
     statement_url: Optional[str] = None
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ContestBundle:
+    """Everything `contest show` displays: user info, problems and compilers."""
+
+    user_info: Dict[str, Any] = field(default_factory=dict)
+    problems: List[Problem] = field(default_factory=list)
+    compilers: List[Compiler] = field(default_factory=list)
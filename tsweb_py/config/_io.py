@@ -0,0 +1,72 @@
+"""
+JSON and file helpers shared by the config modules.
+Uses orjson when installed, falling back to the standard library json.
+Both backends write the same two-space indented layout.
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: bytes):
+        """Parse JSON from bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: bytes):
+        """Parse JSON from bytes."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to indented JSON bytes."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_atomic(path: Path, data: bytes, private: bool = False) -> None:
+    """
+    Write bytes to a unique temp file next to `path`, then atomically replace `path`.
+    An interrupted write leaves the previous file intact instead of truncated JSON,
+    and concurrent writers never share a temp file.
+    The existing file's permission bits are kept; a new file gets 0600 when
+    `private` (credentials, cookies), otherwise the umask default.
+    A symlinked `path` is resolved, so the link is kept and its target replaced.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o600 if private else 0o666 & ~_current_umask()
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _current_umask() -> int:
+    """Return the process umask (it can only be read by setting it)."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
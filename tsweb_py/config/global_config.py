@@ -1,13 +1,21 @@
 """Global configuration management (~/.tsweb_py.global)."""
 
-import json
-import pickle
+import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
+from ._io import JSONDecodeError, dumps, loads, write_atomic
 
-@dataclass
+if TYPE_CHECKING:
+    from requests.cookies import RequestsCookieJar
+
+# Cookie file contents by path as (st_mtime_ns, raw JSON) from the last read or write
+_COOKIE_CACHE: Dict[Path, Tuple[int, bytes]] = {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GlobalConfig:
     """
     Global configuration storing user credentials and session cookies.
@@ -27,10 +35,10 @@ class GlobalConfig:
             return cls()
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = loads(f.read())
                 return cls(user=data.get("user", ""), password=data.get("password", ""))
-        except (json.JSONDecodeError, IOError):
+        except (JSONDecodeError, IOError):
             return cls()
 
     def save(self, path: Optional[Path] = None) -> None:
@@ -39,8 +47,7 @@ class GlobalConfig:
             path = Path.home() / ".tsweb_py.global"
 
         data = {"user": self.user, "password": self.password}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        write_atomic(path, dumps(data), private=True)
 
     def has_credentials(self) -> bool:
         """Check if credentials are stored."""
@@ -48,24 +55,71 @@ class GlobalConfig:
 
     @staticmethod
     def save_cookies(cookies, path: Optional[Path] = None) -> None:
-        """Save cookies using pickle."""
+        """
+        Save cookies as a JSON list of {name, value, domain, path, expires, secure}.
+        Unchanged cookies are not rewritten; the file is only touched, since its
+        mtime records when the session was last confirmed valid.
+        """
         if path is None:
             path = Path.home() / ".tsweb_py.cookies"
 
-        with open(path, "wb") as f:
-            pickle.dump(cookies, f)
+        data = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure,
+            }
+            for cookie in cookies
+        ]
+        raw = dumps(data)
+        # The memo is only trusted while the file is still the one it recorded;
+        # a file rewritten or removed by another process is written out again
+        cached = _COOKIE_CACHE.get(path)
+        try:
+            unchanged = (
+                cached is not None
+                and cached[1] == raw
+                and os.stat(path).st_mtime_ns == cached[0]
+            )
+        except OSError:
+            unchanged = False
+        if unchanged:
+            os.utime(path)
+        else:
+            write_atomic(path, raw, private=True)
+        _COOKIE_CACHE[path] = (os.stat(path).st_mtime_ns, raw)
 
     @staticmethod
-    def load_cookies(path: Optional[Path] = None):
-        """Load cookies using pickle."""
+    def load_cookies(path: Optional[Path] = None) -> Optional["RequestsCookieJar"]:
+        """
+        Load cookies saved by save_cookies.
+        Returns None if the file is missing or unreadable (e.g. an old pickle file).
+        """
         if path is None:
             path = Path.home() / ".tsweb_py.cookies"
 
-        if not path.exists():
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
             return None
 
+        from requests.cookies import RequestsCookieJar, create_cookie
+
         try:
-            with open(path, "rb") as f:
-                return pickle.load(f)
-        except (FileNotFoundError, pickle.UnpicklingError):
+            cached = _COOKIE_CACHE.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                raw = cached[1]
+            else:
+                with open(path, "rb") as f:
+                    raw = f.read()
+                _COOKIE_CACHE[path] = (mtime_ns, raw)
+            data = loads(raw)
+            jar = RequestsCookieJar()
+            for item in data:
+                jar.set_cookie(create_cookie(**item))
+            return jar
+        except (ValueError, IOError, TypeError):
             return None
@@ -1,12 +1,16 @@
 """Local configuration management (.tsweb_py.local)."""
 
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
+from ._io import JSONDecodeError, dumps, loads, write_atomic
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LocalConfig:
     """
     Local configuration for contest-specific settings.
@@ -25,14 +29,14 @@ class LocalConfig:
         if path is None:
             path = cls.find_config()
 
-        if path is None or not path.exists():
+        if path is None:
             return None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return cls(default_lang=data.get("default_lang", 0))
-        except (json.JSONDecodeError, IOError, TypeError):
+            data = loads(path.read_bytes())
+            return cls(default_lang=data.get("default_lang", 0))
+        except (JSONDecodeError, OSError, TypeError, AttributeError):
+            # Missing, unreadable or malformed file
             return None
 
     def save(self, path: Optional[Path] = None) -> None:
@@ -42,8 +46,10 @@ class LocalConfig:
 
         data = {"default_lang": self.default_lang}
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_atomic(path, dumps(data))
+
+        # A new file may now shadow a previously cached lookup
+        _find_config_from.cache_clear()
 
     @staticmethod
     def find_config() -> Optional[Path]:
@@ -51,15 +57,26 @@ class LocalConfig:
         Search for .tsweb_py.local starting from current directory,
         walking up to root.
         """
-        current = Path.cwd()
+        return _find_config_from(os.getcwd())
+
 
-        while True:
-            config_path = current / ".tsweb_py.local"
-            if config_path.exists():
-                return config_path
+@lru_cache(maxsize=1)
+def _find_config_from(start: str) -> Optional[Path]:
+    """
+    Walk up from `start` looking for .tsweb_py.local (memoized per directory).
+    Works on plain strings with one stat per level; only the hit becomes a Path.
+    """
+    current = start
 
-            # Check if we've reached the root
-            if current == current.parent:
-                return None
+    while True:
+        config_path = os.path.join(current, ".tsweb_py.local")
+        # isfile skips a same-named directory and swallows unreadable levels
+        if os.path.isfile(config_path):
+            return Path(config_path)
+
+        # Check if we've reached the root
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
 
-            current = current.parent
+        current = parent
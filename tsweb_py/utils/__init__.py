@@ -7,6 +7,16 @@ from .terminal import (
     scanline,
     scanline_trim,
     clear_screen,
+    get_console,
+    make_problems_table,
+    make_compilers_table,
+    make_submissions_table,
+    make_tests_table,
+    make_contests_table,
+    make_monitor_table,
+    fill_table,
+    submission_row,
+    test_row,
 )
 
 __all__ = [
@@ -16,4 +26,14 @@ __all__ = [
     "scanline",
     "scanline_trim",
     "clear_screen",
+    "get_console",
+    "make_problems_table",
+    "make_compilers_table",
+    "make_submissions_table",
+    "make_tests_table",
+    "make_contests_table",
+    "make_monitor_table",
+    "fill_table",
+    "submission_row",
+    "test_row",
 ]
@@ -1,10 +1,26 @@
 """Utility functions for terminal UI and user input."""
 
-from typing import Optional
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Tuple
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """
+    Return the shared rich console, creating it on first use.
+    Keeps rich out of the import path of commands that never print.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def scanline(prompt: str = "") -> str:
@@ -25,6 +41,7 @@ def choose_index(prompt: str, options: list, max_attempts: int = 3) -> Optional[
     User inputs 1, 2, 3, ... but function returns 0-based index (0, 1, 2, ...).
     Returns the selected 0-based index or None if invalid.
     """
+    console = get_console()
     for _ in range(max_attempts):
         try:
             choice = input(f"{prompt} (1-{len(options)}): ")
@@ -44,30 +61,159 @@ def choose_index(prompt: str, options: list, max_attempts: int = 3) -> Optional[
     return None
 
 
-def create_table(title: str, headers: list) -> Table:
+def create_table(title: str, headers: list) -> "Table":
     """Create a formatted table for display."""
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold cyan")
     for header in headers:
         table.add_column(header)
     return table
 
 
-def clear_screen():
-    """Clear the terminal screen."""
-    console.clear()
+def _new_table(title: Optional[str]) -> "Table":
+    """Create an empty table in the standard style (titled tables use cyan headers)."""
+    from rich.table import Table
 
+    if title:
+        return Table(title=title, show_header=True, header_style="bold cyan")
+    return Table(show_header=True, header_style="bold magenta")
 
-def format_result_color(result: str) -> str:
-    """Format a test result with appropriate color."""
-    result_upper = result.upper()
-
-    if result_upper == "OK" or result_upper == "AC":
-        return f"[green]{result}[/green]"
-    elif result_upper in ["WA", "RT", "RE"]:
-        return f"[red]{result}[/red]"
-    elif result_upper in ["TL", "ML", "TLE", "MLE"]:
-        return f"[magenta]{result}[/magenta]"
-    elif result_upper in ["NO", "JUDGING", "PENDING"]:
-        return f"[yellow]{result}[/yellow]"
+
+def make_problems_table(title: Optional[str] = None, numbered: bool = False) -> "Table":
+    """Create a problems table with its columns set up; `numbered` adds a # column."""
+    table = _new_table(title)
+    if numbered:
+        table.add_column("#", style="cyan")
+        table.add_column("ID", style="yellow")
     else:
+        table.add_column("ID", style="cyan")
+    table.add_column("Name", style="white")
+    return table
+
+
+def make_compilers_table(title: Optional[str] = None) -> "Table":
+    """Create a compilers table with its columns set up."""
+    table = _new_table(title)
+    table.add_column("#", style="cyan")
+    table.add_column("Language", style="yellow")
+    table.add_column("Name", style="white")
+    return table
+
+
+def make_submissions_table(title: Optional[str] = None) -> "Table":
+    """Create a submissions table with its columns set up."""
+    table = _new_table(title)
+    table.add_column("ID", style="cyan")
+    table.add_column("Problem", style="yellow")
+    table.add_column("Compiler", style="white")
+    table.add_column("Result", style="white")
+    table.add_column("Time", style="magenta")
+    return table
+
+
+def make_tests_table(title: Optional[str] = None) -> "Table":
+    """Create a per-test feedback table with its columns set up."""
+    table = _new_table(title)
+    table.add_column("Test", style="cyan")
+    table.add_column("Result", style="white")
+    table.add_column("Time", style="yellow")
+    table.add_column("Memory", style="yellow")
+    table.add_column("Comment", style="white")
+    return table
+
+
+def make_contests_table(title: Optional[str] = "Available Contests") -> "Table":
+    """Create a numbered contests table with its columns set up."""
+    table = _new_table(title)
+    table.add_column("#", style="cyan")
+    table.add_column("ID", style="yellow")
+    table.add_column("Name", style="white")
+    table.add_column("Status", style="magenta")
+    return table
+
+
+def make_monitor_table(headers: Iterable[str]) -> "Table":
+    """
+    Create the contest monitor table for the monitor's header cells.
+    The ID column is left out; unknown headers are narrow problem columns.
+    """
+    from rich.table import Table
+
+    table = Table(
+        title="Contest Monitor", show_header=True, header_style="bold cyan", border_style="blue"
+    )
+    for header in headers:
+        if header == "ID":
+            # Skip ID column - we'll skip it in data too
+            continue
+        elif header == "Team":
+            table.add_column(header, style="white", no_wrap=True, overflow="ellipsis", max_width=15)
+        elif header == "=":
+            table.add_column(header, style="green", justify="right", width=2)
+        elif header == "Time":
+            table.add_column(header, style="yellow", justify="right", width=6)
+        elif header == "Rank":
+            table.add_column(header, style="cyan", justify="right", width=4)
+        else:
+            # Problem columns - narrow to fit in 80 columns
+            table.add_column(header, style="magenta", justify="center", width=3, no_wrap=True)
+    return table
+
+
+def fill_table(table: "Table", rows: Iterable[Sequence[str]]) -> "Table":
+    """Add prepared rows to a table and return it."""
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+    return table
+
+
+def submission_row(sub) -> Tuple[str, ...]:
+    """Cells of a submissions table row."""
+    return (sub.id, sub.problem, sub.compiler, format_result_color(sub.result), sub.time)
+
+
+def test_row(test) -> Tuple[str, ...]:
+    """Cells of a test results table row."""
+    return (
+        test.test_id,
+        format_result_color(test.result),
+        test.time,
+        test.memory,
+        test.comment,
+    )
+
+
+def clear_screen():
+    """Clear the terminal screen."""
+    get_console().clear()
+
+
+# Rich color for each verdict, keyed by upper-cased result
+_RESULT_COLORS = {
+    "OK": "green",
+    "AC": "green",
+    "WA": "red",
+    "RT": "red",
+    "RE": "red",
+    "TL": "magenta",
+    "ML": "magenta",
+    "TLE": "magenta",
+    "MLE": "magenta",
+    "NO": "yellow",
+    "JUDGING": "yellow",
+    "PENDING": "yellow",
+}
+
+
+@lru_cache(maxsize=64)
+def format_result_color(result: str) -> str:
+    """
+    Format a test result with appropriate color.
+    Memoized: results come from a small set of verdicts and repeat on every row.
+    """
+    color = _RESULT_COLORS.get(result.upper())
+    if color is None:
         return result
+    return f"[{color}]{result}[/{color}]"